@@ -1,104 +1,224 @@
 """
 Abstract Syntax Tree (AST) definitions for NooCrush language.
+
+Nodes are plain classes with ``__slots__``: each node stores only its own
+fields plus the few slots the interpreter's resolver fills in (``_eval`` or
+``_exec``, scope slots and cached code), with no per-node ``__dict__``.
+Every node class also carries its kind as the class attribute ``type``.
 """
-from dataclasses import dataclass
-from typing import List, Optional, Any, Dict, Union
+from typing import List, Optional, Any, Dict, Tuple
 
 # Base class for all AST nodes
-@dataclass
 class Node:
     """Base class for all AST nodes."""
-    pass
+    __slots__ = ()
+    type = "node"
+    _fields: Tuple[str, ...] = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+    # Structural equality over _fields, as the generated dataclass __eq__ was;
+    # resolver-filled slots are annotations and do not take part
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+
+    __hash__ = None
 
 # Expressions
-@dataclass
 class Expr(Node):
     """Base class for all expression nodes."""
-    pass
+    __slots__ = ('_eval',)
 
-@dataclass
 class Literal(Expr):
     """Literal value expression (e.g., 42, "hello", true)."""
-    value: Any
-    value_type: str
+    __slots__ = ('value', 'value_type', 'kind', 'number', '_cached')
+    type = "literal"
+    _fields = ('value', 'value_type')
+
+    def __init__(self, value: Any, value_type: str):
+        self.value = value
+        self.value_type = value_type
+        self.kind = None
+        self._cached = None
 
-@dataclass
 class Variable(Expr):
     """Variable reference expression."""
-    name: str
+    __slots__ = ('name', 'hops', 'slot')
+    type = "variable"
+    _fields = ('name',)
+
+    def __init__(self, name: str):
+        self.name = name
+
+class Assign(Expr):
+    """Assignment to a variable."""
+    __slots__ = ('name', 'value', 'hops', 'slot')
+    type = "assign"
+    _fields = ('name', 'value')
+
+    def __init__(self, name: str, value: Expr):
+        self.name = name
+        self.value = value
 
-@dataclass
 class Binary(Expr):
     """Binary operation expression."""
-    left: Expr
-    operator: Any  # Token
-    right: Expr
+    __slots__ = ('left', 'operator', 'right', 'kind')
+    type = "binary"
+    _fields = ('left', 'operator', 'right')
+
+    def __init__(self, left: Expr, operator: Any, right: Expr):
+        self.left = left
+        self.operator = operator  # Token
+        self.right = right
+        self.kind = None
+
+class Logical(Expr):
+    """Short-circuiting logical operation expression."""
+    __slots__ = ('left', 'operator', 'right')
+    type = "logical"
+    _fields = ('left', 'operator', 'right')
+
+    def __init__(self, left: Expr, operator: Any, right: Expr):
+        self.left = left
+        self.operator = operator  # Token
+        self.right = right
 
-@dataclass
 class Unary(Expr):
     """Unary operation expression."""
-    operator: Any  # Token
-    right: Expr
+    __slots__ = ('operator', 'right')
+    type = "unary"
+    _fields = ('operator', 'right')
+
+    def __init__(self, operator: Any, right: Expr):
+        self.operator = operator  # Token
+        self.right = right
+
+class Grouping(Expr):
+    """Parenthesized expression."""
+    __slots__ = ('expression',)
+    type = "grouping"
+    _fields = ('expression',)
+
+    def __init__(self, expression: Expr):
+        self.expression = expression
 
-@dataclass
 class Call(Expr):
     """Function call expression."""
-    callee: Expr
-    arguments: List[Expr]
-    paren: Any  # Token
+    __slots__ = ('callee', 'arguments', 'paren')
+    type = "call"
+    _fields = ('callee', 'arguments', 'paren')
+
+    def __init__(self, callee: Expr, arguments: List[Expr], paren: Any):
+        self.callee = callee
+        self.arguments = arguments
+        self.paren = paren  # Token
 
 # Statements
-@dataclass
 class Stmt(Node):
     """Base class for all statement nodes."""
-    pass
+    __slots__ = ('_exec',)
 
-@dataclass
 class Expression(Stmt):
     """Expression statement."""
-    expression: Expr
+    __slots__ = ('expression',)
+    type = "expression"
+    _fields = ('expression',)
+
+    def __init__(self, expression: Expr):
+        self.expression = expression
+
+class Print(Stmt):
+    """Print statement."""
+    __slots__ = ('expression',)
+    type = "print"
+    _fields = ('expression',)
+
+    def __init__(self, expression: Expr):
+        self.expression = expression
 
-@dataclass
 class Var(Stmt):
     """Variable declaration statement."""
-    name: str
-    initializer: Optional[Expr]
-    var_type: Optional[str] = None
-    is_const: bool = False
+    __slots__ = ('name', 'initializer', 'var_type', 'is_const', 'slot')
+    type = "var"
+    _fields = ('name', 'initializer', 'var_type', 'is_const')
+
+    def __init__(self, name: str, initializer: Optional[Expr],
+                 var_type: Optional[str] = None, is_const: bool = False):
+        self.name = name
+        self.initializer = initializer
+        self.var_type = var_type
+        self.is_const = is_const
+        self.slot = None
 
-@dataclass
 class Block(Stmt):
     """Block of statements."""
-    statements: List[Stmt]
+    __slots__ = ('statements', 'code')
+    type = "block"
+    _fields = ('statements',)
+
+    def __init__(self, statements: List[Stmt]):
+        self.statements = statements
 
-@dataclass
 class If(Stmt):
     """If statement."""
-    condition: Expr
-    then_branch: Stmt
-    else_branch: Optional[Stmt] = None
+    __slots__ = ('condition', 'then_branch', 'else_branch')
+    type = "if"
+    _fields = ('condition', 'then_branch', 'else_branch')
+
+    def __init__(self, condition: Expr, then_branch: Stmt, else_branch: Optional[Stmt] = None):
+        self.condition = condition
+        self.then_branch = then_branch
+        self.else_branch = else_branch
 
-@dataclass
 class Loop(Stmt):
     """Loop statement."""
-    body: Stmt
+    __slots__ = ('body', 'code')
+    type = "loop"
+    _fields = ('body',)
+
+    def __init__(self, body: List[Stmt]):
+        self.body = body
+
+class Break(Stmt):
+    """Break out of the innermost loop."""
+    __slots__ = ()
+    type = "break"
 
-@dataclass
 class Function(Stmt):
     """Function declaration."""
-    name: str
-    parameters: List[Dict[str, str]]  # List of {'name': str, 'type': str}
-    body: List[Stmt]
-    return_type: Optional[str] = None
+    __slots__ = ('name', 'parameters', 'body', 'return_type', 'slot', 'code')
+    type = "function"
+    _fields = ('name', 'parameters', 'body', 'return_type')
+
+    def __init__(self, name: str, parameters: List[Dict[str, Any]],  # List of {'name': str, 'type': str}
+                 body: List[Stmt], return_type: Optional[str] = None):
+        self.name = name
+        self.parameters = parameters
+        self.body = body
+        self.return_type = return_type
+        self.slot = None
 
-@dataclass
 class Return(Stmt):
     """Return statement."""
-    keyword: Any  # Token
-    value: Optional[Expr] = None
+    __slots__ = ('keyword', 'value')
+    type = "return"
+    _fields = ('keyword', 'value')
+
+    def __init__(self, keyword: Any, value: Optional[Expr] = None):
+        self.keyword = keyword  # Token
+        self.value = value
 
-@dataclass
 class Struct(Stmt):
     """Struct declaration."""
-    name: str
-    fields: List[Dict[str, Any]]  # List of {'name': str, 'type': str, 'mutable': bool}
+    __slots__ = ('name', 'fields', 'slot')
+    type = "struct"
+    _fields = ('name', 'fields')
+
+    def __init__(self, name: str, fields: List[Dict[str, Any]]):  # List of {'name': str, 'type': str, 'mutable': bool}
+        self.name = name
+        self.fields = fields
+        self.slot = None
@@ -2,12 +2,14 @@
 Lexical analyzer for the NooCrush programming language.
 """
 import re
+import sys
 from typing import List, Dict, Tuple, Optional, Pattern, Callable, Any
 from dataclasses import dataclass
 from enum import Enum, auto
 
 from noocrush.core.lexer.tokens import (
-    Token, TokenType, KEYWORDS, SINGLE_CHAR_TOKENS, MULTI_CHAR_STARTS,
+    Token, TokenStream, TokenType, KEYWORD_GET,
+    OP_TRIE_GET, CHAR_CLASS, M_IDENT_START, M_IDENT_CONT, M_DIGIT, M_NUM_SEP, M_DOT,
     STRING_QUOTES, WHITESPACE, NEWLINE, INDENT, MAX_INDENT_LEVEL,
     MAX_STRING_LENGTH, MAX_NESTING_LEVEL, MAX_TOKENS_PER_LINE, MAX_LINE_LENGTH,
     MAX_ERRORS, EXPRESSION_STARTERS, TYPE_ANNOTATION_TOKENS, DECORATOR_TOKENS,
@@ -123,7 +125,11 @@ class Lexer:
         """
         self.source = source
         self.filename = filename
+        # ASCII sources are also scanned as bytes, where indexing yields an
+        # int that can go straight into CHAR_CLASS without ord()
+        self.source_bytes: Optional[bytes] = source.encode('ascii') if source.isascii() else None
         self.tokens: List[Token] = []
+        self.stream: Optional[TokenStream] = None
         self.errors: List[LexerError] = []
         self.warnings: List[LexerWarning] = []
         
@@ -175,6 +181,16 @@ class Lexer:
         
         # Comment pattern
         self.comment_pattern = re.compile(r'#[^\n\r]*', re.UNICODE)
+        
+        # Combined pattern for everything the start state can recognise with
+        # a regex, so one C-level match classifies the next lexeme
+        self.start_pattern = re.compile(
+            r'(?P<whitespace>[ \t\f]+)'
+            r'|(?P<newline>\r\n|\n|\r)'
+            r'|(?P<comment>#[^\n\r]*)'
+            r'|(?P<name>[^\W\d]\w*)',
+            re.UNICODE
+        )
     
     def tokenize(self) -> List[Token]:
         """
@@ -220,21 +236,36 @@ class Lexer:
             self.errors.append(e)
             raise
     
+    def tokenize_stream(self) -> TokenStream:
+        """
+        Tokenize the source code into columnar storage.
+        
+        Returns:
+            A TokenStream holding the tokens as parallel arrays instead of
+            a list of Token objects.
+        """
+        self.stream = TokenStream(self.source, self.filename)
+        try:
+            self.tokenize()
+        finally:
+            stream, self.stream = self.stream, None
+        return stream
+    
     def _handle_start(self) -> None:
         """Handle the start state of the lexer."""
-        # Skip whitespace (except newlines which are significant)
-        if self._match_pattern(self.whitespace_pattern):
-            self._advance(len(self._current_match.group(0)))
-            return
-        
-        # Handle newlines and indentation
-        if self._match_pattern(self.newline_pattern):
-            self._handle_newline()
-            return
-        
-        # Handle comments
-        if self._match_pattern(self.comment_pattern):
-            self._handle_comment()
+        # Whitespace, newlines, comments, identifiers and keywords
+        match = self.start_pattern.match(self.source, self.pos)
+        if match is not None:
+            kind = match.lastgroup
+            if kind == 'name':
+                lexeme = sys.intern(match.group())
+                self._advance_inline(len(lexeme))
+                self._add_token(KEYWORD_GET(lexeme, TokenType.IDENTIFIER), lexeme)
+            elif kind == 'newline':
+                self._handle_newline()
+            else:
+                # Whitespace and comments produce no tokens
+                self._advance_inline(match.end() - self.pos)
             return
         
         # Handle string literals
@@ -243,49 +274,40 @@ class Lexer:
             return
         
         # Handle numeric literals
-        if self._current_char().isdigit() or (self._current_char() == '.' and self._peek().isdigit()):
+        if (self._char_class(self._current_char()) & M_DIGIT
+                or (self._current_char() == '.' and self._char_class(self._peek()) & M_DIGIT)):
             self.context.state = LexerState.IN_NUMBER
             return
         
-        # Handle identifiers and keywords
-        if self._current_char().isalpha() or self._current_char() == '_':
-            self.context.state = LexerState.IN_IDENTIFIER
-            return
-        
         # Handle operators and delimiters
         self._handle_operator_or_delimiter()
     
     def _handle_identifier(self) -> None:
         """Handle identifiers and keywords."""
-        if not (self._current_char().isalnum() or self._current_char() == '_'):
-            # End of identifier
-            lexeme = self.source[self.start_pos:self.pos]
-            token_type = KEYWORDS.get(lexeme, TokenType.IDENTIFIER)
-            self._add_token(token_type, lexeme)
-            self.context.state = LexerState.START
-            return
+        # Scan the whole identifier run against the class table
+        self._advance_inline(self._scan_while(M_IDENT_CONT) - self.pos)
         
-        self._advance()
+        lexeme = sys.intern(self.source[self.start_pos:self.pos])
+        token_type = KEYWORD_GET(lexeme, TokenType.IDENTIFIER)
+        self._add_token(token_type, lexeme)
+        self.context.state = LexerState.START
     
     def _handle_number(self) -> None:
         """Handle numeric literals."""
         # Simplified number handling - in a real implementation, this would be more complex
-        while self._current_char().isdigit() or self._current_char() in '._':
-            self._advance()
+        self._advance_inline(self._scan_while(M_DIGIT | M_NUM_SEP | M_DOT) - self.pos)
         
         # Handle decimal point
         if self._current_char() == '.':
             self._advance()
-            while self._current_char().isdigit() or self._current_char() == '_':
-                self._advance()
+            self._advance_inline(self._scan_while(M_DIGIT | M_NUM_SEP) - self.pos)
         
         # Handle exponent
         if self._current_char().lower() == 'e':
             self._advance()
             if self._current_char() in '+-':
                 self._advance()
-            while self._current_char().isdigit() or self._current_char() == '_':
-                self._advance()
+            self._advance_inline(self._scan_while(M_DIGIT | M_NUM_SEP) - self.pos)
         
         # Handle complex numbers
         if self._current_char().lower() == 'j':
@@ -335,9 +357,16 @@ class Lexer:
         
         if self._current_char() == '\n' and len(self._string_quote) == 1:
             self._error("Unterminated string literal")
-        
-        self._advance()
-    
+
+        # Jump over the run of plain characters up to the next quote,
+        # backslash or newline instead of stepping one character at a time
+        end = self.pos + 1
+        length = len(self.source)
+        quote = self._string_quote[0]
+        while end < length and self.source[end] not in (quote, '\\', '\n'):
+            end += 1
+        self._advance_span(end)
+
     def _handle_string_escape(self) -> None:
         """Handle escape sequences in strings."""
         # In a real implementation, this would handle all escape sequences
@@ -346,9 +375,10 @@ class Lexer:
     
     def _handle_comment(self) -> None:
         """Handle comments."""
-        # Skip until end of line
-        while self._current_char() not in ('\n', '\r') and not self._is_at_end():
-            self._advance()
+        # Skip until end of line in a single jump
+        match = self.comment_pattern.match(self.source, self.pos)
+        if match:
+            self._advance_inline(match.end() - self.pos)
         
         # The comment token is not added to the token stream
         self.context.state = LexerState.START
@@ -450,21 +480,28 @@ class Lexer:
         """Handle operators and delimiters."""
         c = self._current_char()
         
-        # Check for multi-character operators first
-        if c in MULTI_CHAR_STARTS and not self._is_at_end(1):
-            next_char = self.source[self.pos + 1]
-            for seq, token_type in MULTI_CHAR_STARTS[c]:
-                if len(seq) > 1 and self.pos + len(seq) <= len(self.source):
-                    if self.source[self.pos:self.pos+len(seq)] == seq:
-                        self._advance(len(seq))
-                        self._add_token(token_type, seq)
-                        return
-        
-        # Check for single-character tokens
-        if c in SINGLE_CHAR_TOKENS:
-            self._add_token(SINGLE_CHAR_TOKENS[c], c)
-            self._advance()
-            return
+        # Walk the operator trie as far as the source allows and keep the
+        # longest operator seen (maximal munch)
+        node = OP_TRIE_GET(c)
+        if node is not None:
+            source = self.source
+            length = len(source)
+            token_type = node.get('')
+            end = self.pos + 1
+            index = end
+            while index < length:
+                node = node.get(source[index])
+                if node is None:
+                    break
+                index += 1
+                if '' in node:
+                    token_type = node['']
+                    end = index
+            if token_type is not None:
+                lexeme = source[self.pos:end]
+                self._advance_inline(end - self.pos)
+                self._add_token(token_type, lexeme)
+                return
         
         # Unknown character
         self._error(f"Unexpected character: {c}")
@@ -484,19 +521,24 @@ class Lexer:
         self.line += 1
         self.column = 1
         
-        # Skip whitespace at beginning of line
-        indent = 0
-        while self._current_char() in WHITESPACE:
-            if self._current_char() == '\t':
-                # Tabs align to multiples of 8
-                indent = (indent // 8 + 1) * 8
-            else:
-                indent += 1
-            self._advance()
-        
+        # Slice out the whole line once so blank and comment-only lines can
+        # be skipped in a single jump instead of a per-character scan
+        line_start = self.pos
+        line_end = self.source.find('\n', line_start)
+        if line_end < 0:
+            line_end = len(self.source)
+        line = self.source[line_start:line_end]
+        stripped = line.lstrip(' \t\f')
+
         # Skip comments and blank lines
-        if self._current_char() in ('\n', '\r', '#'):
+        if not stripped or stripped[0] in ('\r', '#'):
+            self._advance_inline(line_end - line_start)
             return
+
+        # Skip whitespace at beginning of line
+        leading = len(line) - len(stripped)
+        indent = self._measure_indent(line[:leading])
+        self._advance_inline(leading)
         
         # Handle indentation
         current_indent = self.context.indentation_stack[-1]
@@ -513,7 +555,29 @@ class Lexer:
             
             if self.context.indentation_stack[-1] != indent:
                 self._error("Inconsistent indentation")
-    
+
+    def _measure_indent(self, whitespace: str) -> int:
+        """
+        Compute the indentation width of a run of leading whitespace.
+
+        Args:
+            whitespace: The whitespace prefix of a line.
+
+        Returns:
+            The indentation width, with tabs aligned to multiples of 8.
+        """
+        if '\t' not in whitespace:
+            return len(whitespace)
+
+        indent = 0
+        for char in whitespace:
+            if char == '\t':
+                # Tabs align to multiples of 8
+                indent = (indent // 8 + 1) * 8
+            else:
+                indent += 1
+        return indent
+
     def _add_token(self, token_type: TokenType, lexeme: str, literal: Any = None) -> None:
         """
         Add a token to the token list.
@@ -523,13 +587,16 @@ class Lexer:
             lexeme: The actual text from the source code.
             literal: The literal value of the token (for numbers, strings, etc.).
         """
+        if self.stream is not None:
+            self.stream.append(token_type, lexeme, literal, self.start_pos,
+                               self.start_line, self.start_column)
+            return
         self.tokens.append(Token(
             type=token_type,
             lexeme=lexeme,
             literal=literal,
             line=self.start_line,
-            column=self.start_column,
-            filename=self.filename
+            column=self.start_column
         ))
     
     def _error(self, message: str) -> None:
@@ -565,14 +632,96 @@ class Lexer:
         Args:
             n: Number of characters to advance.
         """
-        for _ in range(n):
-            if not self._is_at_end():
-                if self._current_char() in ('\n', '\r'):
-                    self.line += 1
-                    self.column = 1
-                else:
-                    self.column += 1
-                self.pos += 1
+        if n != 1:
+            self._advance_span(min(self.pos + n, len(self.source)))
+            return
+
+        if self.pos < len(self.source):
+            if self.source[self.pos] in ('\n', '\r'):
+                self.line += 1
+                self.column = 1
+            else:
+                self.column += 1
+            self.pos += 1
+
+    def _advance_inline(self, n: int) -> None:
+        """
+        Advance over n characters known not to contain a line break.
+
+        Callers use this for regex-matched spans and operators, so the
+        position and column can be bumped in one step. The span is not
+        checked; passing one that holds a line break desyncs line numbers.
+
+        Args:
+            n: Number of characters to advance.
+        """
+        self.pos += n
+        self.column += n
+
+    def _advance_span(self, new_pos: int) -> None:
+        """
+        Advance to new_pos, updating line and column for any line breaks.
+
+        Args:
+            new_pos: The position to advance to.
+        """
+        # Count '\n' and '\r' separately, as stepping through with
+        # _advance() one character at a time would
+        source = self.source
+        newlines = source.count('\n', self.pos, new_pos) + source.count('\r', self.pos, new_pos)
+        if newlines:
+            self.line += newlines
+            last = max(source.rfind('\n', self.pos, new_pos), source.rfind('\r', self.pos, new_pos))
+            self.column = new_pos - last
+        else:
+            self.column += new_pos - self.pos
+        self.pos = new_pos
+
+    def _scan_while(self, mask: int) -> int:
+        """
+        Find the end of the run of characters whose class matches a mask.
+        
+        Args:
+            mask: CHAR_CLASS bits; a character continues the run if it has
+                any of them.
+            
+        Returns:
+            The index of the first character at or after the current
+            position that does not match.
+        """
+        end = self.pos
+        length = len(self.source)
+        data = self.source_bytes
+        if data is not None:
+            char_class = CHAR_CLASS
+            while end < length and char_class[data[end]] & mask:
+                end += 1
+        else:
+            source = self.source
+            classify = self._char_class
+            while end < length and classify(source[end]) & mask:
+                end += 1
+        return end
+    
+    def _char_class(self, char: str) -> int:
+        """
+        Return the character-class bitmask for a character.
+        
+        Args:
+            char: The character to classify.
+            
+        Returns:
+            The CHAR_CLASS bits for Latin-1 characters, or the equivalent
+            bits computed from the str methods for wider characters.
+        """
+        code = ord(char)
+        if code < 256:
+            return CHAR_CLASS[code]
+        if char.isalpha():
+            return M_IDENT_START | M_IDENT_CONT
+        if char.isdigit():
+            return M_IDENT_CONT | M_DIGIT
+        return M_IDENT_CONT if char.isalnum() else 0
     
     def _current_char(self) -> str:
         """Return the current character, or '\0' if at the end."""
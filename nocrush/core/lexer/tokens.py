@@ -1,9 +1,10 @@
 """
 Token definitions for the NooCrush lexer.
 """
+import sys
+from array import array
 from enum import Enum, auto
-from dataclasses import dataclass
-from typing import Optional, Tuple, Any
+from typing import Optional, Tuple, Any, Dict, Iterator
 
 
 class TokenType(Enum):
@@ -107,15 +108,41 @@ class TokenType(Enum):
     ERROR = "ERROR"
 
 
-@dataclass
 class Token:
-    """Represents a token in the source code."""
-    type: TokenType
-    lexeme: str
-    literal: Any
-    line: int
-    column: int
-    filename: str = "<string>"
+    """
+    Represents a token in the source code.
+    
+    Tokens use __slots__ and carry no filename; the lexer holds the filename
+    once per run and attaches it to errors when they are reported.
+    """
+    __slots__ = ('type', 'lexeme', 'literal', 'line', 'column')
+    
+    def __init__(self, type: TokenType, lexeme: str, literal: Any, line: int, column: int):
+        """
+        Initialize a token.
+        
+        Args:
+            type: The type of the token.
+            lexeme: The actual text from the source code.
+            literal: The literal value of the token, if any.
+            line: The 1-based line the token starts on.
+            column: The 1-based column the token starts at.
+        """
+        self.type = type
+        self.lexeme = lexeme
+        self.literal = literal
+        self.line = line
+        self.column = column
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare tokens field by field."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.type is other.type and self.lexeme == other.lexeme
+                and self.literal == other.literal and self.line == other.line
+                and self.column == other.column)
+    
+    __hash__ = None
     
     def __str__(self) -> str:
         """Return a string representation of the token."""
@@ -127,6 +154,100 @@ class Token:
                 f"literal={self.literal}, line={self.line}, column={self.column})")
 
 
+# Integer codes for token types, used by the columnar TokenStream
+TOKEN_TYPES = tuple(TokenType)
+TOKEN_TYPE_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}
+
+
+class TokenStream:
+    """
+    Columnar (struct-of-arrays) storage for a lexed token sequence.
+    
+    Token types, source offsets, lengths and positions live in parallel
+    ``array('i')`` columns. Lexemes are sliced from the source on demand and
+    only tokens that carry a literal, or whose lexeme is not a plain slice
+    of the source (such as INDENT or DEDENT), get an entry in a side table.
+    The filename is stored once for the whole stream.
+    """
+    __slots__ = ('source', 'filename', 'types', 'starts', 'lengths',
+                 'lines', 'columns', 'literals', 'lexemes')
+    
+    def __init__(self, source: str, filename: str = "<string>"):
+        """
+        Initialize an empty token stream.
+        
+        Args:
+            source: The source code the tokens are sliced from.
+            filename: The name of the source file (for error messages).
+        """
+        self.source = source
+        self.filename = filename
+        self.types = array('i')
+        self.starts = array('i')
+        self.lengths = array('i')
+        self.lines = array('i')
+        self.columns = array('i')
+        self.literals: Dict[int, Any] = {}
+        self.lexemes: Dict[int, str] = {}
+    
+    def append(self, token_type: TokenType, lexeme: str, literal: Any,
+               start: int, line: int, column: int) -> None:
+        """
+        Append a token to the stream.
+        
+        Args:
+            token_type: The type of the token.
+            lexeme: The actual text of the token.
+            literal: The literal value of the token, if any.
+            start: The offset of the token in the source.
+            line: The 1-based line the token starts on.
+            column: The 1-based column the token starts at.
+        """
+        index = len(self.types)
+        self.types.append(TOKEN_TYPE_CODES[token_type])
+        self.starts.append(start)
+        self.lengths.append(len(lexeme))
+        self.lines.append(line)
+        self.columns.append(column)
+        if literal is not None:
+            self.literals[index] = literal
+        if not self.source.startswith(lexeme, start):
+            self.lexemes[index] = lexeme
+    
+    def __len__(self) -> int:
+        """Return the number of tokens in the stream."""
+        return len(self.types)
+    
+    def type_at(self, index: int) -> TokenType:
+        """Return the type of the token at ``index``."""
+        return TOKEN_TYPES[self.types[index]]
+    
+    def lexeme_at(self, index: int) -> str:
+        """Return the lexeme of the token at ``index``."""
+        lexeme = self.lexemes.get(index)
+        if lexeme is None:
+            start = self.starts[index]
+            lexeme = self.source[start:start + self.lengths[index]]
+        return lexeme
+    
+    def __getitem__(self, index: int) -> Token:
+        """Materialize the token at ``index`` as a Token object."""
+        if index < 0:
+            index += len(self.types)
+        return Token(
+            self.type_at(index),
+            self.lexeme_at(index),
+            self.literals.get(index),
+            self.lines[index],
+            self.columns[index],
+        )
+    
+    def __iter__(self) -> Iterator[Token]:
+        """Iterate over the stream, materializing each token."""
+        for index in range(len(self.types)):
+            yield self[index]
+
+
 # Keywords mapping
 KEYWORDS = {
     'and': TokenType.AND,
@@ -168,6 +289,11 @@ KEYWORDS = {
     'yield': TokenType.YIELD,
 }
 
+# Intern the keyword spellings so lookups with interned lexemes can match on
+# identity, and bind the lookup once for the lexer's identifier hot path.
+KEYWORDS = {sys.intern(keyword): token_type for keyword, token_type in KEYWORDS.items()}
+KEYWORD_GET = KEYWORDS.get
+
 # Single-character tokens
 SINGLE_CHAR_TOKENS = {
     '(': TokenType.LEFT_PAREN,
@@ -196,12 +322,50 @@ MULTI_CHAR_STARTS = {
     '-': [('-=', TokenType.MINUS_EQUAL), ('->', TokenType.ANNOTATION)],
     '*': [('*=', TokenType.STAR_EQUAL), ('**', TokenType.STAR_STAR)],
     '/': [('/=', TokenType.SLASH_EQUAL)],
-    '%': ['%=', TokenType.PERCENT_EQUAL],
+    '%': [('%=', TokenType.PERCENT_EQUAL)],
     '&': [('&', TokenType.AMPERSAND)],
     '|': [('|', TokenType.PIPE)],
     '^': [('^', TokenType.CARET)],
 }
 
+# Operator lookup tables: two-character operators keyed by the exact pair and
+# every single-character operator or delimiter keyed by the character, both
+# mapping to (token type, length) so the lexer needs at most two probes.
+OP2 = {
+    seq: (token_type, len(seq))
+    for candidates in MULTI_CHAR_STARTS.values()
+    for seq, token_type in candidates
+    if len(seq) == 2
+}
+OP1 = {char: (token_type, 1) for char, token_type in SINGLE_CHAR_TOKENS.items()}
+for _char in MULTI_CHAR_STARTS:
+    OP1.setdefault(_char, (TokenType(_char), 1))
+del _char
+
+
+def _build_op_trie() -> Dict[str, Any]:
+    """
+    Build a character trie over every operator and delimiter.
+    
+    Returns:
+        A dict keyed by first character. Each node is a dict of child nodes
+        keyed by the next character, with the token type of the operator
+        ending at that node (if any) stored under the empty-string key.
+    """
+    trie: Dict[str, Any] = {}
+    for table in (OP1, OP2):
+        for seq, (token_type, _) in table.items():
+            node = trie
+            for char in seq:
+                node = node.setdefault(char, {})
+            node[''] = token_type
+    return trie
+
+
+# Operator trie for maximal-munch matching of operators of any length
+OP_TRIE = _build_op_trie()
+OP_TRIE_GET = OP_TRIE.get
+
 # All operators for operator precedence
 OPERATORS = {
     # Precedence level 1 (highest)
@@ -257,54 +421,89 @@ OPERATORS = {
 }
 
 # Assignment operators
-ASSIGNMENT_OPS = {
+ASSIGNMENT_OPS = frozenset({
     '=', '+=', '-=', '*=', '/=', '%=', '**=', '//=', '@=',
     '&=', '|=', '^=', '<<=', '>>=', '**=',
-}
+})
 
 # Augmented assignment operators
-AUGMENTED_ASSIGNMENT_OPS = {
+AUGMENTED_ASSIGNMENT_OPS = frozenset({
     '+=', '-=', '*=', '/=', '%=', '**=', '//=', '@=',
     '&=', '|=', '^=', '<<=', '>>=', '**=',
-}
+})
 
 # Comparison operators
-COMPARISON_OPS = {
+COMPARISON_OPS = frozenset({
     '==', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'is', 'is not'
-}
+})
 
 # Binary operators
-BINARY_OPS = {
+BINARY_OPS = frozenset({
     '+', '-', '*', '**', '/', '//', '%', '<<', '>>', '&', '|', '^', '~',
     'and', 'or', 'is', 'is not', 'in', 'not in',
-}
+})
 
 # Unary operators
-UNARY_OPS = {'+', '-', '~', 'not'}
+UNARY_OPS = frozenset({'+', '-', '~', 'not'})
 
 # All keywords that start a statement
-STATEMENT_KEYWORDS = {
+STATEMENT_KEYWORDS = frozenset({
     'if', 'for', 'while', 'try', 'with', 'def', 'class', 'async',
     'return', 'yield', 'raise', 'break', 'continue', 'import', 'from',
     'global', 'nonlocal', 'assert', 'pass', 'del',
-}
+})
 
 # All keywords that start an expression
-EXPRESSION_KEYWORDS = {
+EXPRESSION_KEYWORDS = frozenset({
     'True', 'False', 'None', 'lambda', 'await',
-}
+})
 
 # All reserved keywords
-RESERVED_KEYWORDS = set(KEYWORDS.keys())
+RESERVED_KEYWORDS = frozenset(KEYWORDS)
 
 # String quotes
-STRING_QUOTES = {"'", '"', "'''", '"""'}
+STRING_QUOTES = frozenset({"'", '"', "'''", '"""'})
 
 # Whitespace characters
-WHITESPACE = {' ', '\t', '\f'}
+WHITESPACE = frozenset({' ', '\t', '\f'})
 
 # Newline characters
-NEWLINE = {'\n', '\r', '\r\n'}
+NEWLINE = frozenset({'\n', '\r', '\r\n'})
+
+# Character-class bitmasks for CHAR_CLASS
+M_IDENT_START = 1
+M_IDENT_CONT = 2
+M_WS = 4
+M_NL = 8
+M_DIGIT = 16
+M_NUM_SEP = 32
+M_DOT = 64
+
+
+def _classify(code: int) -> int:
+    """Return the character-class bitmask for a Latin-1 code point."""
+    char = chr(code)
+    mask = 0
+    if char.isalpha() or char == '_':
+        mask |= M_IDENT_START | M_IDENT_CONT
+    if char.isdigit():
+        mask |= M_IDENT_CONT | M_DIGIT
+    elif char.isalnum():
+        mask |= M_IDENT_CONT
+    if char in WHITESPACE:
+        mask |= M_WS
+    if char in NEWLINE:
+        mask |= M_NL
+    if char == '_':
+        mask |= M_NUM_SEP
+    if char == '.':
+        mask |= M_DOT
+    return mask
+
+
+# One byte of class bits per Latin-1 code point, tested as
+# CHAR_CLASS[ord(c)] & mask; wider characters fall back to the str methods
+CHAR_CLASS = bytes(_classify(code) for code in range(256))
 
 # Indentation characters
 INDENT = '    '  # 4 spaces
@@ -328,34 +527,34 @@ MAX_LINE_LENGTH = 1000
 MAX_ERRORS = 100
 
 # Token types that can start an expression
-EXPRESSION_STARTERS = {
+EXPRESSION_STARTERS = frozenset({
     TokenType.LEFT_PAREN, TokenType.LEFT_BRACKET, TokenType.LEFT_BRACE,
     TokenType.NAME, TokenType.NUMBER, TokenType.STRING,
     TokenType.TRUE, TokenType.FALSE, TokenType.NONE,
     TokenType.NOT, TokenType.MINUS, TokenType.PLUS, TokenType.TILDE,
     TokenType.STAR, TokenType.STAR_STAR,
-}
+})
 
 # Token types that can be used in a type annotation
-TYPE_ANNOTATION_TOKENS = {
+TYPE_ANNOTATION_TOKENS = frozenset({
     TokenType.NAME, TokenType.LEFT_BRACKET, TokenType.RIGHT_BRACKET,
     TokenType.COMMA, TokenType.ELLIPSIS, TokenType.COLON,
     TokenType.OR, TokenType.PIPE,  # For Union types (X | Y)
-}
+})
 
 # Token types that can appear in a decorator
-DECORATOR_TOKENS = {
+DECORATOR_TOKENS = frozenset({
     TokenType.NAME, TokenType.DOT, TokenType.LEFT_PAREN,
     TokenType.RIGHT_PAREN, TokenType.COMMA, TokenType.EQUAL,
     TokenType.STRING, TokenType.NUMBER, TokenType.TRUE, TokenType.FALSE,
     TokenType.NONE, TokenType.ELLIPSIS,
-}
+})
 
 # Token types that can appear in a slice
-SLICE_TOKENS = {
+SLICE_TOKENS = frozenset({
     TokenType.COLON, TokenType.NUMBER, TokenType.NAME,
     TokenType.LEFT_PAREN, TokenType.RIGHT_PAREN,
     TokenType.PLUS, TokenType.MINUS, TokenType.STAR, TokenType.SLASH,
     TokenType.PERCENT, TokenType.LEFT_BRACKET, TokenType.RIGHT_BRACKET,
     TokenType.COMMA,
-}
+})
@@ -1,16 +1,17 @@
 """
 Error handling for the NooCrush language.
 """
+import sys
 from dataclasses import dataclass
 from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 
 class ErrorLevel:
     """Error severity levels."""
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
-    HINT = "hint"
+    ERROR = sys.intern("error")
+    WARNING = sys.intern("warning")
+    INFO = sys.intern("info")
+    HINT = sys.intern("hint")
 
 @dataclass
 class SourceLocation:
@@ -100,11 +101,15 @@ class Error:
             "related": self.related
         }
     
-    def format(self, source: Optional[str] = None) -> str:
-        """Format the error message with source context if available."""
+    def format(self, source: Optional[str] = None, lines: Optional[List[str]] = None) -> str:
+        """Format the error message with source context if available.
+        
+        ``lines`` may carry the source already split into lines, which lets
+        callers formatting many errors against one source split it once.
+        """
         from ..utils import format_error
         
-        if not self.location or not source:
+        if not self.location or not (source or lines):
             return self.message
         
         return format_error(
@@ -113,7 +118,8 @@ class Error:
             col=self.location.column,
             file=self.location.file,
             code=source,
-            context_lines=2
+            context_lines=2,
+            lines=lines
         )
 
 class ErrorReporter:
@@ -192,7 +198,8 @@ class ErrorReporter:
     
     def format_all(self, source: Optional[str] = None) -> List[str]:
         """Format all messages with source context if available."""
-        return [msg.format(source) for msg in self.get_all_messages()]
+        lines = source.splitlines() if source else None
+        return [msg.format(source, lines) for msg in self.get_all_messages()]
     
     def clear(self) -> None:
         """Clear all messages."""
@@ -4,50 +4,101 @@ Interpreter for the NooCrush language.
 import sys
 import math
 import random
-from typing import Dict, List, Any, Optional, Union, Callable
-from dataclasses import dataclass
-from enum import Enum, auto
-
-class ValueType(Enum):
-    NUMBER = auto()
-    STRING = auto()
-    BOOLEAN = auto()
-    NULL = auto()
-    LIST = auto()
-    FUNCTION = auto()
-    BUILTIN_FUNCTION = auto()
-    STRUCT = auto()
-    INSTANCE = auto()
-
-@dataclass
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
+
+from .ast import (
+    Stmt, Expr, Literal, Variable, Assign, Binary, Call,
+    Expression, Print, Var, Block, If, Loop, Break, Function, Return
+)
+
+# Runtime type tags. Plain ints compare faster than Enum members on the
+# interpreter's hot paths.
+T_NUMBER = 0
+T_STRING = 1
+T_BOOLEAN = 2
+T_NULL = 3
+T_LIST = 4
+T_FUNCTION = 5
+T_BUILTIN_FUNCTION = 6
+T_STRUCT = 7
+T_INSTANCE = 8
+
+class ValueType:
+    """Namespace of the runtime type tags, kept for stdlib and extensions."""
+    NUMBER = T_NUMBER
+    STRING = T_STRING
+    BOOLEAN = T_BOOLEAN
+    NULL = T_NULL
+    LIST = T_LIST
+    FUNCTION = T_FUNCTION
+    BUILTIN_FUNCTION = T_BUILTIN_FUNCTION
+    STRUCT = T_STRUCT
+    INSTANCE = T_INSTANCE
+
+def _format_number(number) -> str:
+    # Numbers are mostly floats from literals and arithmetic, but builtins
+    # such as len() return ints, which have no is_integer() before 3.12
+    if number.__class__ is int:
+        return str(number)
+    if number.is_integer():
+        return str(int(number))
+    return repr(number)
+
 class Value:
-    type: ValueType
-    value: Any
+    __slots__ = ("type", "value")
+
+    def __init__(self, type: int, value: Any):
+        self.type = type
+        self.value = value
+
+    def __repr__(self):
+        return f"Value(type={self.type!r}, value={self.value!r})"
+
+    def __eq__(self, other):
+        if other.__class__ is not Value:
+            return NotImplemented
+        return self.type == other.type and self.value == other.value
+
+    __hash__ = None
 
     def __str__(self):
-        if self.type == ValueType.NULL:
+        if self.type == T_NUMBER:
+            return _format_number(self.value)
+        elif self.type == T_NULL:
             return "null"
-        elif self.type == ValueType.BOOLEAN:
+        elif self.type == T_BOOLEAN:
             return "true" if self.value else "false"
-        elif self.type == ValueType.NUMBER:
-            return str(int(self.value) if self.value.is_integer() else self.value)
         return str(self.value)
 
     def is_truthy(self) -> bool:
-        if self.type == ValueType.NULL:
+        if self.type == T_NULL:
             return False
-        if self.type == ValueType.BOOLEAN:
+        if self.type == T_BOOLEAN:
             return self.value
         return True
 
+# Shared immutable results so null and boolean paths do not allocate
+NULL = Value(T_NULL, None)
+TRUE = Value(T_BOOLEAN, True)
+FALSE = Value(T_BOOLEAN, False)
+
 class Environment:
+    __slots__ = ("values", "slots", "enclosing")
+
     def __init__(self, enclosing=None):
         self.values: Dict[str, Value] = {}
+        self.slots: List[Value] = []
         self.enclosing = enclosing
     
     def define(self, name: str, value: Value):
         self.values[name] = value
     
+    def define_at(self, slot: int, value: Value):
+        if slot < len(self.slots):
+            self.slots[slot] = value
+        else:
+            self.slots.append(value)
+    
     def get(self, name: str) -> Value:
         if name in self.values:
             return self.values[name]
@@ -57,6 +108,13 @@ class Environment:
         
         raise RuntimeError(f"Undefined variable '{name}'.")
     
+    def get_at(self, hops: int, slot: int) -> Value:
+        env = self
+        while hops:
+            env = env.enclosing
+            hops -= 1
+        return env.slots[slot]
+    
     def assign(self, name: str, value: Value):
         if name in self.values:
             self.values[name] = value
@@ -67,166 +125,419 @@ class Environment:
             return
         
         raise RuntimeError(f"Undefined variable '{name}'.")
+    
+    def assign_at(self, hops: int, slot: int, value: Value):
+        env = self
+        while hops:
+            env = env.enclosing
+            hops -= 1
+        env.slots[slot] = value
+
+def _unknown_statement(interpreter, stmt: Stmt) -> Value:
+    raise RuntimeError(f"Unknown statement type: {stmt.type}")
+
+def _unknown_expression(interpreter, expr: Expr) -> Value:
+    raise RuntimeError(f"Unknown expression type: {expr.type}")
+
+class Resolver:
+    """Resolve local variable references to (hops, slot) pairs.
+    
+    Walks the AST produced by the parser once before it is interpreted and
+    annotates every ``Var``, ``Variable`` and ``Assign`` node in place.
+    Local bindings get a ``slot`` index into their scope's
+    ``Environment.slots`` and references get the number of ``hops`` up
+    the environment chain. Names that are not found in any local scope are
+    globals or builtins and get ``hops = -1`` so the interpreter falls back
+    to the dict lookup on ``Interpreter.globals``.
+    
+    The same walk stores each node's handler from the interpreter's tables
+    as ``_exec`` (statements) or ``_eval`` (expressions), and flattens
+    every statement list into a ``code`` tuple of ``(handler, node)``
+    pairs that the interpreter runs without touching the node types.
+    """
+    
+    def __init__(self, stmt_handlers: Dict[str, Callable], expr_handlers: Dict[str, Callable]):
+        self.scopes: List[Dict[str, int]] = []
+        self.stmt_handlers = stmt_handlers
+        self.expr_handlers = expr_handlers
+    
+    def resolve(self, statements: List[Stmt]) -> Tuple[Tuple[Callable, Stmt], ...]:
+        for statement in statements:
+            self._resolve_stmt(statement)
+        return tuple((statement._exec, statement) for statement in statements)
+    
+    def _begin_scope(self):
+        self.scopes.append({})
+    
+    def _end_scope(self):
+        self.scopes.pop()
+    
+    def _declare(self, name: str) -> Optional[int]:
+        if not self.scopes:
+            return None
+        scope = self.scopes[-1]
+        slot = scope.get(name)
+        if slot is None:
+            slot = scope[name] = len(scope)
+        return slot
+    
+    def _resolve_local(self, node: Union[Variable, Assign]):
+        name = node.name
+        for depth in range(len(self.scopes) - 1, -1, -1):
+            slot = self.scopes[depth].get(name)
+            if slot is not None:
+                node.hops = len(self.scopes) - 1 - depth
+                node.slot = slot
+                return
+        node.hops = -1
+    
+    def _fold_kind(self, expr: Binary):
+        # A "+" whose operands are both statically numbers (or both strings)
+        # can be computed on raw Python values and boxed once at the top.
+        left_kind = getattr(expr.left, "kind", None)
+        if left_kind is None or expr.operator.lexeme != "+":
+            return
+        if getattr(expr.right, "kind", None) == left_kind:
+            expr.kind = left_kind
+            expr._eval = self.expr_handlers.get(left_kind, expr._eval)
+    
+    def _resolve_block(self, statements: List[Stmt]) -> Tuple[Tuple[Callable, Stmt], ...]:
+        self._begin_scope()
+        code = self.resolve(statements)
+        self._end_scope()
+        return code
+    
+    def _resolve_stmt(self, stmt: Stmt):
+        kind = stmt.type
+        stmt._exec = self.stmt_handlers.get(kind, _unknown_statement)
+        if kind in ("expression", "print"):
+            self._resolve_expr(stmt.expression)
+        elif kind == "var":
+            if stmt.initializer is not None:
+                self._resolve_expr(stmt.initializer)
+            stmt.slot = self._declare(stmt.name)
+        elif kind == "block":
+            stmt.code = self._resolve_block(stmt.statements)
+        elif kind == "if":
+            self._resolve_expr(stmt.condition)
+            self._resolve_stmt(stmt.then_branch)
+            if stmt.else_branch is not None:
+                self._resolve_stmt(stmt.else_branch)
+        elif kind == "loop":
+            stmt.code = self._resolve_block(stmt.body)
+        elif kind == "function":
+            stmt.slot = self._declare(stmt.name)
+            self._begin_scope()
+            for param in stmt.parameters:
+                param["slot"] = self._declare(param["name"])
+            stmt.code = self.resolve(stmt.body)
+            self._end_scope()
+        elif kind == "return":
+            if stmt.value is not None:
+                self._resolve_expr(stmt.value)
+        elif kind == "struct":
+            stmt.slot = self._declare(stmt.name)
+    
+    def _resolve_expr(self, expr: Expr):
+        kind = expr.type
+        expr._eval = self.expr_handlers.get(kind, _unknown_expression)
+        if kind == "literal":
+            if expr.value_type == "number":
+                expr.kind = "number"
+                expr.number = float(expr.value)
+            elif expr.value_type == "string":
+                expr.kind = "string"
+        elif kind == "variable":
+            self._resolve_local(expr)
+        elif kind == "assign":
+            self._resolve_expr(expr.value)
+            self._resolve_local(expr)
+        elif kind in ("binary", "logical"):
+            self._resolve_expr(expr.left)
+            self._resolve_expr(expr.right)
+            if kind == "binary":
+                self._fold_kind(expr)
+        elif kind == "unary":
+            self._resolve_expr(expr.right)
+        elif kind == "grouping":
+            self._resolve_expr(expr.expression)
+        elif kind == "call":
+            self._resolve_expr(expr.callee)
+            for argument in expr.arguments:
+                self._resolve_expr(argument)
+
+def _builtin_print(args: List[Value], interpreter: "Interpreter") -> Value:
+    print(" ".join(str(arg) for arg in args))
+    return NULL
+
+def _builtin_len(args: List[Value], interpreter: "Interpreter") -> Value:
+    if len(args) != 1:
+        raise RuntimeError(f"Expected 1 argument, got {len(args)}.")
+    
+    value = args[0]
+    if value.type == T_STRING or value.type == T_LIST:
+        return Value(T_NUMBER, len(value.value))
+    
+    raise RuntimeError("Can only get length of strings and lists.")
+
+def _builtin_input(args: List[Value], interpreter: "Interpreter") -> Value:
+    if args:
+        print(args[0].value, end="")
+    return Value(T_STRING, input())
+
+# Control-flow signals. Statements normally return a Value; "return" and
+# "break" return a _Signal instead, which blocks and loops pass outward
+# without raising and unwinding a Python exception.
+_NORMAL = 0
+_RETURN = 1
+_BREAK = 2
 
-class ReturnException(Exception):
-    def __init__(self, value: Value):
+class _Signal:
+    __slots__ = ("kind", "value")
+
+    def __init__(self, kind: int, value: Value):
+        self.kind = kind
         self.value = value
 
+_BREAK_SIGNAL = _Signal(_BREAK, NULL)
+
 class Interpreter:
     def __init__(self):
         self.globals = Environment()
         self.environment = self.globals
+        # Globals are never slot-resolved, so reads and writes to them go
+        # straight to the dict instead of through Environment.get/assign
+        self._globals_dict = self.globals.values
         self._init_native_functions()
     
     def _init_native_functions(self):
-        # Built-in functions
-        self.globals.define("print", Value(ValueType.BUILTIN_FUNCTION, self._print))
-        self.globals.define("len", Value(ValueType.BUILTIN_FUNCTION, self._len))
-        self.globals.define("input", Value(ValueType.BUILTIN_FUNCTION, self._input))
-    
-    def _print(self, args: List[Value]) -> Value:
-        print(" ".join(str(arg) for arg in args))
-        return Value(ValueType.NULL, None)
-    
-    def _len(self, args: List[Value]) -> Value:
-        if len(args) != 1:
-            raise RuntimeError(f"Expected 1 argument, got {len(args)}.")
-        
-        value = args[0]
-        if value.type == ValueType.STRING or value.type == ValueType.LIST:
-            return Value(ValueType.NUMBER, len(value.value))
-        
-        raise RuntimeError("Can only get length of strings and lists.")
+        # Built-in functions, stored as (func, arity, name) and called
+        # directly by _expr_call. An arity of -1 accepts any argument count;
+        # a name of None lets errors propagate without the "Error in" prefix.
+        self.globals.define("print", Value(T_BUILTIN_FUNCTION, (_builtin_print, -1, None)))
+        self.globals.define("len", Value(T_BUILTIN_FUNCTION, (_builtin_len, -1, None)))
+        self.globals.define("input", Value(T_BUILTIN_FUNCTION, (_builtin_input, -1, None)))
     
-    def _input(self, args: List[Value]) -> Value:
-        if args:
-            print(args[0].value, end="")
-        return Value(ValueType.STRING, input())
-    
-    def interpret(self, statements: List[Dict]):
+    def interpret(self, statements: List[Stmt]):
+        code = Resolver(self.STMT_HANDLERS, self.EXPR_HANDLERS).resolve(statements)
         try:
             result = None
-            for statement in statements:
-                result = self._execute(statement)
+            for handler, statement in code:
+                result = handler(self, statement)
+                if result.__class__ is _Signal:
+                    return result.value
             return result
         except RuntimeError as e:
             print(f"Runtime error: {e}")
             return None
     
-    def _execute(self, stmt: Dict) -> Value:
-        if stmt["type"] == "expression":
-            return self._evaluate(stmt["expression"])
-        elif stmt["type"] == "print":
-            value = self._evaluate(stmt["expression"])
-            print(self._stringify(value))
-            return Value(ValueType.NULL, None)
-        elif stmt["type"] == "var":
-            value = self._evaluate(stmt["initializer"]) if "initializer" in stmt else Value(ValueType.NULL, None)
-            self.environment.define(stmt["name"], value)
-            return value
-        elif stmt["type"] == "block":
-            return self._execute_block(stmt["statements"])
-        elif stmt["type"] == "if":
-            if self._is_truthy(self._evaluate(stmt["condition"])):
-                return self._execute(stmt["then_branch"])
-            elif "else_branch" in stmt:
-                return self._execute(stmt["else_branch"])
-            return Value(ValueType.NULL, None)
-        elif stmt["type"] == "loop":
-            while True:
-                try:
-                    self._execute_block(stmt["body"])
-                except BreakException:
+    def _execute(self, stmt: Stmt) -> Value:
+        return stmt._exec(self, stmt)
+    
+    def _stmt_expression(self, stmt: Expression) -> Value:
+        return self._evaluate(stmt.expression)
+    
+    def _stmt_print(self, stmt: Print) -> Value:
+        value = self._evaluate(stmt.expression)
+        print(self._stringify(value))
+        return NULL
+    
+    def _stmt_var(self, stmt: Var) -> Value:
+        value = self._evaluate(stmt.initializer) if stmt.initializer is not None else NULL
+        if stmt.slot is not None:
+            self.environment.define_at(stmt.slot, value)
+        else:
+            self.environment.define(stmt.name, value)
+        return value
+    
+    def _stmt_block(self, stmt: Block) -> Value:
+        return self._execute_block(stmt.code)
+    
+    def _stmt_if(self, stmt: If) -> Value:
+        if self._is_truthy(self._evaluate(stmt.condition)):
+            return self._execute(stmt.then_branch)
+        elif stmt.else_branch is not None:
+            return self._execute(stmt.else_branch)
+        return NULL
+    
+    def _stmt_loop(self, stmt: Loop) -> Value:
+        while True:
+            result = self._execute_block(stmt.code)
+            if result.__class__ is _Signal:
+                if result.kind == _BREAK:
                     break
-            return Value(ValueType.NULL, None)
-        elif stmt["type"] == "function":
-            function = Value(ValueType.FUNCTION, stmt)
-            self.environment.define(stmt["name"], function)
-            return function
-        elif stmt["type"] == "return":
-            value = self._evaluate(stmt["value"]) if "value" in stmt else Value(ValueType.NULL, None)
-            raise ReturnException(value)
-        
-        raise RuntimeError(f"Unknown statement type: {stmt['type']}")
+                return result
+        return NULL
+    
+    def _stmt_function(self, stmt: Function) -> Value:
+        function = Value(T_FUNCTION, stmt)
+        if stmt.slot is not None:
+            self.environment.define_at(stmt.slot, function)
+        else:
+            self.environment.define(stmt.name, function)
+        return function
+    
+    def _stmt_return(self, stmt: Return) -> Value:
+        value = self._evaluate(stmt.value) if stmt.value is not None else NULL
+        return _Signal(_RETURN, value)
+    
+    def _stmt_break(self, stmt: Break) -> _Signal:
+        return _BREAK_SIGNAL
     
-    def _execute_block(self, statements: List[Dict], environment: Environment = None) -> Value:
+    def _execute_block(self, code: Tuple[Tuple[Callable, Stmt], ...], environment: Environment = None) -> Value:
         previous = self.environment
         try:
             self.environment = environment if environment is not None else Environment(previous)
-            result = Value(ValueType.NULL, None)
-            for statement in statements:
-                result = self._execute(statement)
+            result = NULL
+            for handler, statement in code:
+                result = handler(self, statement)
+                if result.__class__ is _Signal:
+                    break
             return result
         finally:
             self.environment = previous
     
-    def _evaluate(self, expr: Dict) -> Value:
-        if expr["type"] == "literal":
-            if expr["value_type"] == "number":
-                return Value(ValueType.NUMBER, float(expr["value"]))
-            elif expr["value_type"] == "string":
-                return Value(ValueType.STRING, expr["value"])
-            elif expr["value_type"] == "boolean":
-                return Value(ValueType.BOOLEAN, expr["value"])
-            else:
-                return Value(ValueType.NULL, None)
+    def _evaluate(self, expr: Expr) -> Value:
+        return expr._eval(self, expr)
+    
+    def _expr_literal(self, expr: Literal) -> Value:
+        # Literal Values are never mutated, so each node boxes its value once
+        cached = expr._cached
+        if cached is not None:
+            return cached
+        if expr.value_type == "number":
+            cached = Value(T_NUMBER, float(expr.value))
+        elif expr.value_type == "string":
+            cached = Value(T_STRING, expr.value)
+        elif expr.value_type == "boolean":
+            cached = TRUE if expr.value else FALSE
+        else:
+            cached = NULL
+        expr._cached = cached
+        return cached
+    
+    def _expr_variable(self, expr: Variable) -> Value:
+        hops = expr.hops
+        if hops < 0:
+            try:
+                return self._globals_dict[expr.name]
+            except KeyError:
+                raise RuntimeError(f"Undefined variable '{expr.name}'.") from None
+        if hops == 0:
+            return self.environment.slots[expr.slot]
+        return self.environment.get_at(hops, expr.slot)
+    
+    def _expr_assign(self, expr: Assign) -> Value:
+        value = expr.value
+        value = value._eval(self, value)
+        hops = expr.hops
+        if hops < 0:
+            if expr.name not in self._globals_dict:
+                raise RuntimeError(f"Undefined variable '{expr.name}'.")
+            self._globals_dict[expr.name] = value
+        elif hops == 0:
+            self.environment.slots[expr.slot] = value
+        else:
+            self.environment.assign_at(hops, expr.slot, value)
+        return value
+    
+    def _expr_binary(self, expr: Binary) -> Value:
+        left = expr.left
+        left = left._eval(self, left)
+        right = expr.right
+        right = right._eval(self, right)
         
-        elif expr["type"] == "variable":
-            return self.environment.get(expr["name"])
+        operator = expr.operator.lexeme
         
-        elif expr["type"] == "assign":
-            value = self._evaluate(expr["value"])
-            self.environment.assign(expr["name"], value)
-            return value
+        if operator == "+":
+            if left.type == T_NUMBER and right.type == T_NUMBER:
+                return Value(T_NUMBER, left.value + right.value)
+            elif left.type == T_STRING and right.type == T_STRING:
+                return Value(T_STRING, left.value + right.value)
+            else:
+                raise RuntimeError("Operands must be two numbers or two strings.")
         
-        elif expr["type"] == "binary":
-            left = self._evaluate(expr["left"])
-            right = self._evaluate(expr["right"])
-            
-            operator = expr["operator"].lexeme
-            
-            if operator == "+":
-                if left.type == ValueType.NUMBER and right.type == ValueType.NUMBER:
-                    return Value(ValueType.NUMBER, left.value + right.value)
-                elif left.type == ValueType.STRING and right.type == ValueType.STRING:
-                    return Value(ValueType.STRING, left.value + right.value)
-                else:
-                    raise RuntimeError("Operands must be two numbers or two strings.")
-            
-            # Other binary operators...
-            
-            raise RuntimeError(f"Unknown operator: {operator}")
+        # Other binary operators...
         
-        elif expr["type"] == "call":
-            callee = self._evaluate(expr["callee"])
-            arguments = [self._evaluate(arg) for arg in expr["arguments"]]
-            
-            if callee.type == ValueType.BUILTIN_FUNCTION:
-                return callee.value(arguments)
-            
-            raise RuntimeError("Can only call functions and methods.")
+        raise RuntimeError(f"Unknown operator: {operator}")
+    
+    def _expr_number(self, expr: Expr) -> Value:
+        return Value(T_NUMBER, self._eval_number(expr))
+    
+    def _expr_string(self, expr: Expr) -> Value:
+        return Value(T_STRING, self._eval_str(expr))
+    
+    def _eval_number(self, expr: Expr) -> float:
+        if expr.type == "literal":
+            return expr.number
+        return self._eval_number(expr.left) + self._eval_number(expr.right)
+    
+    def _eval_str(self, expr: Expr) -> str:
+        if expr.type == "literal":
+            return expr.value
+        return self._eval_str(expr.left) + self._eval_str(expr.right)
+    
+    def _expr_call(self, expr: Call) -> Value:
+        callee = self._evaluate(expr.callee)
+        arguments = [self._evaluate(arg) for arg in expr.arguments]
+        
+        if callee.type == T_BUILTIN_FUNCTION:
+            func, arity, name = callee.value
+            if arity >= 0 and len(arguments) != arity:
+                raise RuntimeError(f"Expected {arity} arguments but got {len(arguments)}.")
+            if name is None:
+                return func(arguments, self)
+            try:
+                return func(arguments, self)
+            except Exception as e:
+                raise RuntimeError(f"Error in {name}: {str(e)}")
         
-        raise RuntimeError(f"Unknown expression type: {expr['type']}")
+        raise RuntimeError("Can only call functions and methods.")
+    
+    # Handler tables, keyed by node "type". The resolver stores the matching
+    # function on each node as "_exec"/"_eval" so dispatch needs no lookup.
+    STMT_HANDLERS = {
+        "expression": _stmt_expression,
+        "print": _stmt_print,
+        "var": _stmt_var,
+        "block": _stmt_block,
+        "if": _stmt_if,
+        "loop": _stmt_loop,
+        "function": _stmt_function,
+        "return": _stmt_return,
+        "break": _stmt_break,
+    }
+    
+    EXPR_HANDLERS = {
+        "literal": _expr_literal,
+        "variable": _expr_variable,
+        "assign": _expr_assign,
+        "binary": _expr_binary,
+        "call": _expr_call,
+        # Statically typed "+" subtrees, selected by the resolver's "kind"
+        "number": _expr_number,
+        "string": _expr_string,
+    }
     
     def _is_truthy(self, value: Value) -> bool:
-        if value.type == ValueType.NULL:
+        if value.type == T_NULL:
             return False
-        if value.type == ValueType.BOOLEAN:
+        if value.type == T_BOOLEAN:
             return value.value
         return True
     
     def _stringify(self, value: Value) -> str:
-        if value.type == ValueType.NULL:
+        value_type = value.type
+        if value_type == T_NUMBER:
+            return _format_number(value.value)
+        if value_type == T_STRING:
+            return value.value
+        if value_type == T_NULL:
             return "null"
-        if value.type == ValueType.BOOLEAN:
+        if value_type == T_BOOLEAN:
             return "true" if value.value else "false"
-        if value.type == ValueType.NUMBER:
-            return str(int(value.value) if value.value.is_integer() else value.value)
         return str(value.value)
 
-class BreakException(Exception):
-    pass
-
 def run(source: str):
     from .lexer import Scanner
     from .parser import Parser
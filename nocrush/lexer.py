@@ -1,77 +1,190 @@
 ""
 Lexical analyzer (tokenizer) for the NooCrush language.
 """
-from enum import Enum, auto
+import re
+import sys
+from array import array
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional
 
-class TokenType(Enum):
+class TokenType:
+    # Plain int codes rather than Enum members, so every type comparison in
+    # the scanner and parser is a plain int compare
+    
     # Single-character tokens
-    LEFT_BRACE = auto()
-    RIGHT_BRACE = auto()
-    LEFT_PAREN = auto()
-    RIGHT_PAREN = auto()
-    COMMA = auto()
-    DOT = auto()
-    MINUS = auto()
-    PLUS = auto()
-    SEMICOLON = auto()
-    SLASH = auto()
-    STAR = auto()
-    BACKTICK = auto()
-    COLON = auto()
+    LEFT_BRACE = 0
+    RIGHT_BRACE = 1
+    LEFT_PAREN = 2
+    RIGHT_PAREN = 3
+    COMMA = 4
+    DOT = 5
+    MINUS = 6
+    PLUS = 7
+    SEMICOLON = 8
+    SLASH = 9
+    STAR = 10
+    BACKTICK = 11
+    COLON = 12
     
     # One or two character tokens
-    BANG = auto()
-    BANG_EQUAL = auto()
-    EQUAL = auto()
-    EQUAL_EQUAL = auto()
-    GREATER = auto()
-    GREATER_EQUAL = auto()
-    LESS = auto()
-    LESS_EQUAL = auto()
+    BANG = 13
+    BANG_EQUAL = 14
+    EQUAL = 15
+    EQUAL_EQUAL = 16
+    GREATER = 17
+    GREATER_EQUAL = 18
+    LESS = 19
+    LESS_EQUAL = 20
+    ARROW = 21
     
     # Literals
-    IDENTIFIER = auto()
-    STRING = auto()
-    NUMBER = auto()
+    IDENTIFIER = 22
+    STRING = 23
+    NUMBER = 24
     
     # Keywords
-    AND = auto()
-    ASYNC = auto()
-    AWAIT = auto()
-    BREAK = auto()
-    CONST = auto()
-    ELSE = auto()
-    FALSE = auto()
-    FN = auto()
-    FOR = auto()
-    IF = auto()
-    IN = auto()
-    LET = auto()
-    LOOP = auto()
-    MUT = auto()
-    RETURN = auto()
-    STRUCT = auto()
-    TRUE = auto()
+    AND = 25
+    OR = 26
+    ASYNC = 27
+    AWAIT = 28
+    BREAK = 29
+    CONST = 30
+    ELSE = 31
+    FALSE = 32
+    FN = 33
+    FOR = 34
+    IF = 35
+    IN = 36
+    LET = 37
+    LOOP = 38
+    MUT = 39
+    RETURN = 40
+    STRUCT = 41
+    TRUE = 42
     
     # Types
-    NUMBER_TYPE = auto()
-    STRING_TYPE = auto()
-    BOOL_TYPE = auto()
+    NUMBER_TYPE = 43
+    STRING_TYPE = 44
+    BOOL_TYPE = 45
     
-    EOF = auto()
+    EOF = 46
+
+TOKEN_TYPE_NAMES = {
+    code: name for name, code in vars(TokenType).items() if not name.startswith('_')
+}
+
+# One alternation covering the whole grammar. ERROR matches any single
+# character, so finditer walks the source without gaps.
+_TOKEN_RE = re.compile(r'''
+    (?P<WS>[ \t\r\n]+)
+  | (?P<COMMENT>//[^\n]*|/\*.*?(?:\*/|\Z))
+  | (?P<NUMBER>\d+(?:\.\d+)?)
+  | (?P<IDENT>[^\W\d]\w*)
+  | (?P<STRING>"[^"]*"?)
+  | (?P<OP>[!=<>]=?|->|&&|\|\||[(){},.\-+;*/`:])
+  | (?P<ERROR>.)
+''', re.VERBOSE | re.DOTALL)
+
+_WS_RE = re.compile(r'[ \t\r\n]*')
+
+_OPERATORS = {
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    ',': TokenType.COMMA,
+    '.': TokenType.DOT,
+    '-': TokenType.MINUS,
+    '->': TokenType.ARROW,
+    '+': TokenType.PLUS,
+    ';': TokenType.SEMICOLON,
+    '/': TokenType.SLASH,
+    '*': TokenType.STAR,
+    '`': TokenType.BACKTICK,
+    ':': TokenType.COLON,
+    '!': TokenType.BANG,
+    '!=': TokenType.BANG_EQUAL,
+    '=': TokenType.EQUAL,
+    '==': TokenType.EQUAL_EQUAL,
+    '>': TokenType.GREATER,
+    '>=': TokenType.GREATER_EQUAL,
+    '<': TokenType.LESS,
+    '<=': TokenType.LESS_EQUAL,
+    '&&': TokenType.AND,
+    '||': TokenType.OR,
+}
+
+# ASCII classification tables indexed by ord(c); characters outside ASCII
+# fall back to the str predicates
+_DIGIT = bytes(1 if chr(i).isdigit() else 0 for i in range(128))
+_ID_CONT = bytes(1 if chr(i).isalnum() or chr(i) == '_' else 0 for i in range(128))
+
+def _skip_digits(source: str, i: int, n: int) -> int:
+    """Return the index of the first non-digit in source[i:n]."""
+    while i < n:
+        o = ord(source[i])
+        if not (_DIGIT[o] if o < 128 else source[i].isdigit()):
+            break
+        i += 1
+    return i
 
 class Token:
-    def __init__(self, type: TokenType, lexeme: str, literal: Any, line: int):
+    __slots__ = ('type', 'lexeme', 'literal', 'line')
+    
+    def __init__(self, type: int, lexeme: str, literal: Any, line: int):
         self.type = type
         self.lexeme = lexeme
         self.literal = literal
         self.line = line
     
     def __str__(self):
-        return f"{self.type} {self.lexeme} {self.literal}"
+        return f"{TOKEN_TYPE_NAMES[self.type]} {self.lexeme} {self.literal}"
+
+class TokenStream:
+    """Scanned tokens stored as parallel columns rather than Token objects.
+    
+    Indexing materializes a Token on demand, so code that only inspects
+    token types never allocates one.
+    """
+    __slots__ = ('types', 'lexemes', 'literals', 'lines')
+    
+    def __init__(self):
+        self.types = array('i')
+        self.lexemes: List[str] = []
+        self.literals: List[Any] = []
+        self.lines = array('i')
+    
+    @classmethod
+    def from_tokens(cls, tokens: List[Token]) -> 'TokenStream':
+        # Build each column in one pass so it is allocated at its final size
+        # rather than grown a token at a time
+        stream = cls()
+        stream.types = array('i', [token.type for token in tokens])
+        stream.lexemes = [token.lexeme for token in tokens]
+        stream.literals = [token.literal for token in tokens]
+        stream.lines = array('i', [token.line for token in tokens])
+        return stream
+    
+    def append(self, type: int, lexeme: str, literal: Any, line: int):
+        self.types.append(type)
+        self.lexemes.append(lexeme)
+        self.literals.append(literal)
+        self.lines.append(line)
+    
+    def __len__(self) -> int:
+        return len(self.types)
+    
+    def __getitem__(self, index: int) -> Token:
+        return Token(self.types[index], self.lexemes[index], self.literals[index], self.lines[index])
+    
+    def __iter__(self):
+        return map(Token, self.types, self.lexemes, self.literals, self.lines)
 
 class Scanner:
+    # Fixed attribute layout: instance state lives in slots rather than a
+    # per-instance __dict__, which makes the scanner's attribute loads cheaper
+    __slots__ = ('source', 'tokens', 'start', 'current', 'line')
+    
     keywords = {
         'and': TokenType.AND,
         'async': TokenType.ASYNC,
@@ -87,6 +200,7 @@ class Scanner:
         'let': TokenType.LET,
         'loop': TokenType.LOOP,
         'mut': TokenType.MUT,
+        'or': TokenType.OR,
         'return': TokenType.RETURN,
         'struct': TokenType.STRUCT,
         'true': TokenType.TRUE,
@@ -95,7 +209,12 @@ class Scanner:
         'Bool': TokenType.BOOL_TYPE,
     }
     
-    def __init__(self, source: str):
+    def __init__(self, source: str = ""):
+        self.reset(source)
+    
+    def reset(self, source: str):
+        # Rewind onto a new source so one scanner can serve many inputs.
+        # Tokens go into a fresh list; earlier scan_tokens results are kept.
         self.source = source
         self.tokens = []
         self.start = 0
@@ -103,112 +222,159 @@ class Scanner:
         self.line = 1
     
     def scan_tokens(self) -> List[Token]:
-        while not self.is_at_end():
-            self.start = self.current
-            self.scan_token()
-        
-        self.tokens.append(Token(TokenType.EOF, "", None, self.line))
+        # list.extend takes its size hint from TokenStream.__len__, so the
+        # token list grows once to its final length
+        self.tokens.extend(self.scan_token_stream())
         return self.tokens
     
-    def scan_token(self):
-        c = self.advance()
-        
-        if c == '(': self.add_token(TokenType.LEFT_PAREN)
-        elif c == ')': self.add_token(TokenType.RIGHT_PAREN)
-        elif c == '{': self.add_token(TokenType.LEFT_BRACE)
-        elif c == '}': self.add_token(TokenType.RIGHT_BRACE)
-        elif c == ',': self.add_token(TokenType.COMMA)
-        elif c == '.': self.add_token(TokenType.DOT)
-        elif c == '-': self.add_token(TokenType.MINUS)
-        elif c == '+': self.add_token(TokenType.PLUS)
-        elif c == ';': self.add_token(TokenType.SEMICOLON)
-        elif c == '*': self.add_token(TokenType.STAR)
-        elif c == '`': self.add_token(TokenType.BACKTICK)
-        elif c == ':': self.add_token(TokenType.COLON)
-        
-        elif c == '!':
-            self.add_token(TokenType.BANG_EQUAL if self.match('=') else TokenType.BANG)
-        elif c == '=':
-            self.add_token(TokenType.EQUAL_EQUAL if self.match('=') else TokenType.EQUAL)
-        elif c == '<':
-            self.add_token(TokenType.LESS_EQUAL if self.match('=') else TokenType.LESS)
-        elif c == '>':
-            self.add_token(TokenType.GREATER_EQUAL if self.match('=') else TokenType.GREATER)
+    def scan_token_stream(self) -> TokenStream:
+        # Scan with the compiled alternation so the character loop runs in
+        # the regex engine; scan_token remains for stepping one token at a time
+        source = self.source
+        pos = self.current
+        base_line = self.line
+        newlines = [m.start() for m in re.finditer('\n', source[pos:])]
+        stream = TokenStream()
+        add_type = stream.types.append
+        add_lexeme = stream.lexemes.append
+        add_literal = stream.literals.append
+        add_line = stream.lines.append
+        keywords_by_length = _KEYWORDS_BY_LENGTH
+        identifier = TokenType.IDENTIFIER
+        intern = sys.intern
+        numbers: Dict[str, float] = {}
         
-        elif c == '/':
-            if self.match('/'):
-                # A comment goes until the end of the line
-                while self.peek() != '\n' and not self.is_at_end():
-                    self.advance()
-            elif self.match('*'):
-                # Block comment
-                while not (self.peek() == '*' and self.peek_next() == '/') and not self.is_at_end():
-                    if self.peek() == '\n':
-                        self.line += 1
-                    self.advance()
-                
-                # Consume the closing '*'
-                if not self.is_at_end():
-                    self.advance()  # '*'
-                    self.advance()  # '/'
+        for m in _TOKEN_RE.finditer(source, pos):
+            kind = m.lastgroup
+            if kind == 'WS' or kind == 'COMMENT':
+                continue
+            
+            text = m.group()
+            literal = None
+            if kind == 'IDENT':
+                bucket = keywords_by_length.get(len(text))
+                token_type = bucket.get(text, identifier) if bucket else identifier
+                if token_type == identifier:
+                    # Repeated names share one string object
+                    text = intern(text)
+            elif kind == 'OP':
+                token_type = _OPERATORS[text]
+            elif kind == 'NUMBER':
+                token_type = TokenType.NUMBER
+                # Programs repeat a few literals (0, 1, ...) many times;
+                # convert each distinct spelling once per scan
+                literal = numbers.get(text)
+                if literal is None:
+                    literal = numbers[text] = float(text)
+            elif kind == 'STRING':
+                if len(text) < 2 or text[-1] != '"':
+                    print("Unterminated string.")
+                    continue
+                token_type = TokenType.STRING
+                literal = text[1:-1]
             else:
-                self.add_token(TokenType.SLASH)
-        
-        elif c in [' ', '\r', '\t']:
-            # Ignore whitespace
-            pass
-        elif c == '\n':
-            self.line += 1
+                print(f"Unexpected character: {text}")
+                continue
+            
+            add_type(token_type)
+            add_lexeme(text)
+            add_literal(literal)
+            add_line(base_line + bisect_left(newlines, m.end() - pos))
         
-        elif c == '"':
-            self.string()
+        self.start = self.current = len(source)
+        self.line = base_line + len(newlines)
+        stream.append(TokenType.EOF, "", None, self.line)
+        return stream
+    
+    def scan_token(self):
+        c = self.advance()
         
+        o = ord(c)
+        handler = _DISPATCH[o] if o < 128 else None
+        if handler is not None:
+            handler(self)
+        elif c.isdigit():
+            self.number()
+        elif c.isalpha():
+            self.identifier()
         else:
-            if c.isdigit():
-                self.number()
-            elif c.isalpha() or c == '_':
-                self.identifier()
+            print(f"Unexpected character: {c}")
+    
+    def slash(self):
+        source = self.source
+        i = self.current
+        if self.match('/'):
+            # A comment goes until the end of the line
+            end = source.find('\n', i)
+            self.current = end if end != -1 else len(source)
+        elif self.match('*'):
+            # Block comment
+            i += 1
+            end = source.find('*/', i)
+            if end == -1:
+                self.line += source.count('\n', i)
+                self.current = len(source)
             else:
-                print(f"Unexpected character: {c}")
+                # Consume the closing '*/'
+                self.line += source.count('\n', i, end)
+                self.current = end + 2
+        else:
+            self.add_token(TokenType.SLASH)
+    
+    def whitespace(self):
+        # Consume the rest of the blank run with one regex match rather than
+        # a dispatch per character
+        end = _WS_RE.match(self.source, self.current).end()
+        self.line += self.source.count('\n', self.start, end)
+        self.current = end
     
     def identifier(self):
-        while self.peek().isalnum() or self.peek() == '_':
-            self.advance()
+        source = self.source
+        n = len(source)
+        i = self.current
+        while i < n:
+            o = ord(source[i])
+            if not (_ID_CONT[o] if o < 128 else source[i].isalnum()):
+                break
+            i += 1
+        self.current = i
         
-        text = self.source[self.start:self.current]
-        token_type = self.keywords.get(text, TokenType.IDENTIFIER)
-        self.add_token(token_type)
+        # Only identifiers whose length matches some keyword need slicing
+        # and hashing; everything else is an identifier outright
+        bucket = _KEYWORDS_BY_LENGTH.get(self.current - self.start)
+        if bucket:
+            text = self.source[self.start:self.current]
+            self.add_token(bucket.get(text, TokenType.IDENTIFIER))
+        else:
+            self.add_token(TokenType.IDENTIFIER)
     
     def number(self):
-        while self.peek().isdigit():
-            self.advance()
+        source = self.source
+        n = len(source)
+        i = _skip_digits(source, self.current, n)
         
         # Look for a fractional part
-        if self.peek() == '.' and self.peek_next().isdigit():
-            # Consume the "."
-            self.advance()
-            
-            while self.peek().isdigit():
-                self.advance()
+        if i + 1 < n and source[i] == '.' and _skip_digits(source, i + 1, i + 2) > i + 1:
+            # Consume the "." and the digits after it
+            i = _skip_digits(source, i + 1, n)
         
+        self.current = i
         self.add_token(TokenType.NUMBER, float(self.source[self.start:self.current]))
     
     def string(self):
-        while self.peek() != '"' and not self.is_at_end():
-            if self.peek() == '\n':
-                self.line += 1
-            self.advance()
-        
-        if self.is_at_end():
+        source = self.source
+        end = source.find('"', self.current)
+        if end == -1:
+            self.line += source.count('\n', self.current)
+            self.current = len(source)
             print("Unterminated string.")
             return
         
-        # The closing "
-        self.advance()
-        
-        # Trim the surrounding quotes
-        value = self.source[self.start + 1:self.current - 1]
-        self.add_token(TokenType.STRING, value)
+        # Consume through the closing "; the literal is everything between
+        # the quotes, already delimited by start and the find() result
+        self.line += source.count('\n', self.current, end)
+        self.current = end + 1
+        self.add_token(TokenType.STRING, source[self.start + 1:end])
     
     def match(self, expected: str) -> bool:
         if self.is_at_end():
@@ -236,6 +402,67 @@ class Scanner:
         self.current += 1
         return self.source[self.current - 1]
     
-    def add_token(self, type: TokenType, literal: Any = None):
+    def add_token(self, type: int, literal: Any = None):
         text = self.source[self.start:self.current]
+        if type == TokenType.IDENTIFIER:
+            text = sys.intern(text)
         self.tokens.append(Token(type, text, literal, self.line))
+
+
+def _single(token_type: int):
+    return lambda scanner: scanner.add_token(token_type)
+
+def _one_or_two(second: str, two: int, one: int):
+    return lambda scanner: scanner.add_token(two if scanner.match(second) else one)
+
+def _double(c: str, token_type: int):
+    def handler(scanner):
+        if scanner.match(c):
+            scanner.add_token(token_type)
+        else:
+            print(f"Unexpected character: {c}")
+    return handler
+
+def _build_dispatch() -> List[Any]:
+    """Build the ASCII jump table used by Scanner.scan_token."""
+    table: List[Any] = [None] * 128
+    
+    for c, token_type in (
+        ('(', TokenType.LEFT_PAREN), (')', TokenType.RIGHT_PAREN),
+        ('{', TokenType.LEFT_BRACE), ('}', TokenType.RIGHT_BRACE),
+        (',', TokenType.COMMA), ('.', TokenType.DOT),
+        ('+', TokenType.PLUS),
+        (';', TokenType.SEMICOLON), ('*', TokenType.STAR),
+        ('`', TokenType.BACKTICK), (':', TokenType.COLON),
+    ):
+        table[ord(c)] = _single(token_type)
+    
+    for c, two, one in (
+        ('!', TokenType.BANG_EQUAL, TokenType.BANG),
+        ('=', TokenType.EQUAL_EQUAL, TokenType.EQUAL),
+        ('<', TokenType.LESS_EQUAL, TokenType.LESS),
+        ('>', TokenType.GREATER_EQUAL, TokenType.GREATER),
+    ):
+        table[ord(c)] = _one_or_two('=', two, one)
+    table[ord('-')] = _one_or_two('>', TokenType.ARROW, TokenType.MINUS)
+    table[ord('&')] = _double('&', TokenType.AND)
+    table[ord('|')] = _double('|', TokenType.OR)
+    
+    table[ord('/')] = Scanner.slash
+    for c in ' \r\t\n':
+        table[ord(c)] = Scanner.whitespace
+    table[ord('"')] = Scanner.string
+    
+    for c in '0123456789':
+        table[ord(c)] = Scanner.number
+    for c in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_':
+        table[ord(c)] = Scanner.identifier
+    
+    return table
+
+_DISPATCH = _build_dispatch()
+
+_KEYWORDS_BY_LENGTH: Dict[int, Dict[str, int]] = {}
+for _keyword, _token_type in Scanner.keywords.items():
+    _KEYWORDS_BY_LENGTH.setdefault(len(_keyword), {})[_keyword] = _token_type
+del _keyword, _token_type
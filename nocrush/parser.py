@@ -1,25 +1,65 @@
 """
 Parser for the NooCrush language.
 """
+import sys
+from bisect import bisect_left
 from typing import List, Dict, Any, Optional, Union
-from .lexer import Token, TokenType
+from .lexer import Token, TokenStream, TokenType
+from .ast import (
+    Stmt, Expr, Literal, Variable, Assign, Binary, Logical, Unary, Grouping, Call,
+    Expression, Var, Block, If, Loop, Function, Return, Struct
+)
+
+# Token types that start a declaration or statement; error recovery resumes
+# at one of these or right after a ';'
+_SYNC_TYPES = frozenset((
+    TokenType.FN, TokenType.STRUCT, TokenType.LET,
+    TokenType.IF, TokenType.LOOP, TokenType.RETURN
+))
+
+# Operator sets for the left-associative binary levels, tested with a single
+# membership check against the current token type
+_EQUALITY_OPS = frozenset((TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL))
+_COMPARISON_OPS = frozenset((
+    TokenType.GREATER, TokenType.GREATER_EQUAL,
+    TokenType.LESS, TokenType.LESS_EQUAL
+))
+_TERM_OPS = frozenset((TokenType.MINUS, TokenType.PLUS))
+_FACTOR_OPS = frozenset((TokenType.SLASH, TokenType.STAR))
+
+# Shared name strings for the builtin type keywords, so every annotation of
+# a builtin type refers to the same interned object
+_BUILTIN_TYPE_NAMES = {
+    TokenType.NUMBER_TYPE: sys.intern("Number"),
+    TokenType.STRING_TYPE: sys.intern("String"),
+    TokenType.BOOL_TYPE: sys.intern("Bool"),
+}
 
 class ParseError(Exception):
     pass
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    __slots__ = ('tokens', 'types', 'current', 'sync_points')
+    
+    def __init__(self, tokens: Union[List[Token], TokenStream]):
+        if not isinstance(tokens, TokenStream):
+            tokens = TokenStream.from_tokens(tokens)
         self.tokens = tokens
+        # Type checks read the column directly; Token objects are only
+        # built when a rule asks for one through peek() or previous()
+        self.types = tokens.types
         self.current = 0
+        # Sorted recovery positions, built on the first parse error
+        self.sync_points: Optional[List[int]] = None
     
-    def parse(self) -> List[Dict]:
+    def parse(self) -> List[Stmt]:
         try:
             return self.program()
         except ParseError as e:
             print(f"Parse error: {e}")
             return []
     
-    def program(self) -> List[Dict]:
+    def program(self) -> List[Stmt]:
         statements = []
         while not self.is_at_end():
             declaration = self.declaration()
@@ -27,7 +67,7 @@ class Parser:
                 statements.append(declaration)
         return statements
     
-    def declaration(self) -> Optional[Dict]:
+    def declaration(self) -> Optional[Stmt]:
         try:
             if self.match(TokenType.FN):
                 return self.function_declaration("function")
@@ -40,7 +80,7 @@ class Parser:
             self.synchronize()
             return None
     
-    def function_declaration(self, kind: str) -> Dict:
+    def function_declaration(self, kind: str) -> Stmt:
         name = self.consume(TokenType.IDENTIFIER, f"Expect {kind} name.")
         
         self.consume(TokenType.LEFT_PAREN, f"Expect '(' after {kind} name.")
@@ -67,22 +107,16 @@ class Parser:
         
         # Return type annotation
         return_type = None
-        if self.match(TokenType.MINUS, TokenType.GREATER):
+        if self.match(TokenType.ARROW):
             return_type = self.parse_type()
         
         # Function body
         self.consume(TokenType.LEFT_BRACE, f"Expect '{{' before {kind} body.")
         body = self.block_statement()
         
-        return {
-            "type": "function",
-            "name": name.lexeme,
-            "parameters": parameters,
-            "return_type": return_type,
-            "body": body
-        }
+        return Function(name.lexeme, parameters, body, return_type)
     
-    def struct_declaration(self) -> Dict:
+    def struct_declaration(self) -> Stmt:
         name = self.consume(TokenType.IDENTIFIER, "Expect struct name.")
         self.consume(TokenType.LEFT_BRACE, "Expect '{' before struct body.")
         
@@ -92,11 +126,7 @@ class Parser:
         
         self.consume(TokenType.RIGHT_BRACE, "Expect '}' after struct body.")
         
-        return {
-            "type": "struct",
-            "name": name.lexeme,
-            "fields": fields
-        }
+        return Struct(name.lexeme, fields)
     
     def struct_field(self) -> Dict:
         mutable = self.match(TokenType.MUT)
@@ -112,18 +142,18 @@ class Parser:
         }
     
     def parse_type(self) -> str:
-        if self.match(TokenType.NUMBER_TYPE):
-            return "Number"
-        elif self.match(TokenType.STRING_TYPE):
-            return "String"
-        elif self.match(TokenType.BOOL_TYPE):
-            return "Bool"
-        elif self.check(TokenType.IDENTIFIER):
-            return self.advance().lexeme
+        token_type = self.types[self.current]
+        name = _BUILTIN_TYPE_NAMES.get(token_type)
+        if name is not None:
+            self.current += 1
+            return name
+        elif token_type == TokenType.IDENTIFIER:
+            self.current += 1
+            return self.tokens.lexemes[self.current - 1]
         else:
             self.error(self.peek(), "Expect type.")
     
-    def var_declaration(self) -> Dict:
+    def var_declaration(self) -> Stmt:
         is_const = self.previous().type == TokenType.CONST
         name = self.consume(TokenType.IDENTIFIER, "Expect variable name.")
         
@@ -137,15 +167,9 @@ class Parser:
         
         self.consume(TokenType.SEMICOLON, "Expect ';' after variable declaration.")
         
-        return {
-            "type": "var",
-            "name": name.lexeme,
-            "var_type": var_type,
-            "initializer": initializer,
-            "is_const": is_const
-        }
+        return Var(name.lexeme, initializer, var_type, is_const)
     
-    def statement(self) -> Dict:
+    def statement(self) -> Stmt:
         if self.match(TokenType.IF):
             return self.if_statement()
         elif self.match(TokenType.LOOP):
@@ -153,11 +177,11 @@ class Parser:
         elif self.match(TokenType.RETURN):
             return self.return_statement()
         elif self.match(TokenType.LEFT_BRACE):
-            return {"type": "block", "statements": self.block_statement()}
+            return Block(self.block_statement())
         else:
             return self.expression_statement()
     
-    def if_statement(self) -> Dict:
+    def if_statement(self) -> Stmt:
         self.consume(TokenType.LEFT_PAREN, "Expect '(' after 'if'.")
         condition = self.expression()
         self.consume(TokenType.RIGHT_PAREN, "Expect ')' after if condition.")
@@ -168,23 +192,15 @@ class Parser:
         if self.match(TokenType.ELSE):
             else_branch = self.statement()
         
-        return {
-            "type": "if",
-            "condition": condition,
-            "then_branch": then_branch,
-            "else_branch": else_branch
-        }
+        return If(condition, then_branch, else_branch)
     
-    def loop_statement(self) -> Dict:
+    def loop_statement(self) -> Stmt:
         self.consume(TokenType.LEFT_BRACE, "Expect '{' before loop body.")
         body = self.block_statement()
         
-        return {
-            "type": "loop",
-            "body": body
-        }
+        return Loop(body)
     
-    def return_statement(self) -> Dict:
+    def return_statement(self) -> Stmt:
         keyword = self.previous()
         value = None
         
@@ -192,13 +208,9 @@ class Parser:
             value = self.expression()
         
         self.consume(TokenType.SEMICOLON, "Expect ';' after return value.")
-        return {
-            "type": "return",
-            "keyword": keyword,
-            "value": value
-        }
+        return Return(keyword, value)
     
-    def block_statement(self) -> List[Dict]:
+    def block_statement(self) -> List[Stmt]:
         statements = []
         
         while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
@@ -209,139 +221,105 @@ class Parser:
         self.consume(TokenType.RIGHT_BRACE, "Expect '}' after block.")
         return statements
     
-    def expression_statement(self) -> Dict:
+    def expression_statement(self) -> Stmt:
         expr = self.expression()
         self.consume(TokenType.SEMICOLON, "Expect ';' after expression.")
-        return {
-            "type": "expression",
-            "expression": expr
-        }
+        return Expression(expr)
     
-    def expression(self) -> Dict:
+    def expression(self) -> Expr:
         return self.assignment()
     
-    def assignment(self) -> Dict:
+    def assignment(self) -> Expr:
         expr = self.or_()
         
         if self.match(TokenType.EQUAL):
             equals = self.previous()
             value = self.assignment()
             
-            if expr["type"] == "variable":
-                return {
-                    "type": "assign",
-                    "name": expr["name"],
-                    "value": value
-                }
+            if expr.__class__ is Variable:
+                return Assign(expr.name, value)
             
             self.error(equals, "Invalid assignment target.")
         
         return expr
     
-    def or_(self) -> Dict:
+    def or_(self) -> Expr:
         expr = self.and_()
         
-        while self.match(TokenType.OR):
+        while self.types[self.current] == TokenType.OR:
+            self.current += 1
             operator = self.previous()
             right = self.and_()
-            expr = {
-                "type": "logical",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Logical(expr, operator, right)
         
         return expr
     
-    def and_(self) -> Dict:
+    def and_(self) -> Expr:
         expr = self.equality()
         
-        while self.match(TokenType.AND):
+        while self.types[self.current] == TokenType.AND:
+            self.current += 1
             operator = self.previous()
             right = self.equality()
-            expr = {
-                "type": "logical",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Logical(expr, operator, right)
         
         return expr
     
-    def equality(self) -> Dict:
+    def equality(self) -> Expr:
         expr = self.comparison()
         
-        while self.match(TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL):
+        while self.types[self.current] in _EQUALITY_OPS:
+            self.current += 1
             operator = self.previous()
             right = self.comparison()
-            expr = {
-                "type": "binary",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Binary(expr, operator, right)
         
         return expr
     
-    def comparison(self) -> Dict:
+    def comparison(self) -> Expr:
         expr = self.term()
         
-        while self.match(TokenType.GREATER, TokenType.GREATER_EQUAL, 
-                         TokenType.LESS, TokenType.LESS_EQUAL):
+        while self.types[self.current] in _COMPARISON_OPS:
+            self.current += 1
             operator = self.previous()
             right = self.term()
-            expr = {
-                "type": "binary",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Binary(expr, operator, right)
         
         return expr
     
-    def term(self) -> Dict:
+    def term(self) -> Expr:
         expr = self.factor()
         
-        while self.match(TokenType.MINUS, TokenType.PLUS):
+        while self.types[self.current] in _TERM_OPS:
+            self.current += 1
             operator = self.previous()
             right = self.factor()
-            expr = {
-                "type": "binary",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Binary(expr, operator, right)
         
         return expr
     
-    def factor(self) -> Dict:
+    def factor(self) -> Expr:
         expr = self.unary()
         
-        while self.match(TokenType.SLASH, TokenType.STAR):
+        while self.types[self.current] in _FACTOR_OPS:
+            self.current += 1
             operator = self.previous()
             right = self.unary()
-            expr = {
-                "type": "binary",
-                "left": expr,
-                "operator": operator,
-                "right": right
-            }
+            expr = Binary(expr, operator, right)
         
         return expr
     
-    def unary(self) -> Dict:
-        if self.match(TokenType.BANG, TokenType.MINUS):
+    def unary(self) -> Expr:
+        token_type = self.types[self.current]
+        if token_type == TokenType.BANG or token_type == TokenType.MINUS:
+            self.current += 1
             operator = self.previous()
             right = self.unary()
-            return {
-                "type": "unary",
-                "operator": operator,
-                "right": right
-            }
+            return Unary(operator, right)
         
         return self.call()
     
-    def call(self) -> Dict:
+    def call(self) -> Expr:
         expr = self.primary()
         
         while True:
@@ -352,7 +330,7 @@ class Parser:
         
         return expr
     
-    def finish_call(self, callee: Dict) -> Dict:
+    def finish_call(self, callee: Expr) -> Expr:
         arguments = []
         
         if not self.check(TokenType.RIGHT_PAREN):
@@ -367,44 +345,49 @@ class Parser:
         
         paren = self.consume(TokenType.RIGHT_PAREN, "Expect ')' after arguments.")
         
-        return {
-            "type": "call",
-            "callee": callee,
-            "arguments": arguments,
-            "paren": paren
-        }
+        return Call(callee, arguments, paren)
     
-    def primary(self) -> Dict:
-        if self.match(TokenType.FALSE):
-            return {"type": "literal", "value": False, "value_type": "boolean"}
-        if self.match(TokenType.TRUE):
-            return {"type": "literal", "value": True, "value_type": "boolean"}
-        if self.match(TokenType.NUMBER, TokenType.STRING):
-            return {
-                "type": "literal",
-                "value": self.previous().literal,
-                "value_type": "number" if self.previous().type == TokenType.NUMBER else "string"
-            }
-        if self.match(TokenType.IDENTIFIER):
-            return {"type": "variable", "name": self.previous().lexeme}
-        if self.match(TokenType.LEFT_PAREN):
+    def primary(self) -> Expr:
+        # Read the current type once and branch on it, instead of a match()
+        # call per alternative
+        token_type = self.types[self.current]
+        
+        if token_type == TokenType.IDENTIFIER:
+            self.current += 1
+            return Variable(self.tokens.lexemes[self.current - 1])
+        if token_type == TokenType.NUMBER or token_type == TokenType.STRING:
+            self.current += 1
+            return Literal(
+                self.tokens.literals[self.current - 1],
+                "number" if token_type == TokenType.NUMBER else "string"
+            )
+        if token_type == TokenType.FALSE:
+            self.current += 1
+            return Literal(False, "boolean")
+        if token_type == TokenType.TRUE:
+            self.current += 1
+            return Literal(True, "boolean")
+        if token_type == TokenType.LEFT_PAREN:
+            self.current += 1
             expr = self.expression()
             self.consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
-            return {"type": "grouping", "expression": expr}
+            return Grouping(expr)
         
         raise self.error(self.peek(), "Expect expression.")
     
     def match(self, *types: TokenType) -> bool:
+        current = self.types[self.current]
+        if current == TokenType.EOF:
+            return False
         for type in types:
-            if self.check(type):
-                self.advance()
+            if current == type:
+                self.current += 1
                 return True
         return False
     
     def check(self, type: TokenType) -> bool:
-        if self.is_at_end():
-            return False
-        return self.peek().type == type
+        current = self.types[self.current]
+        return current == type and current != TokenType.EOF
     
     def advance(self) -> Token:
         if not self.is_at_end():
@@ -412,7 +395,7 @@ class Parser:
         return self.previous()
     
     def is_at_end(self) -> bool:
-        return self.peek().type == TokenType.EOF
+        return self.types[self.current] == TokenType.EOF
     
     def peek(self) -> Token:
         return self.tokens[self.current]
@@ -431,16 +414,20 @@ class Parser:
         return ParseError()
     
     def synchronize(self) -> None:
-        self.advance()
+        if not self.is_at_end():
+            self.current += 1
         
-        while not self.is_at_end():
-            if self.previous().type == TokenType.SEMICOLON:
-                return
-            
-            if self.peek().type in [
-                TokenType.FN, TokenType.STRUCT, TokenType.LET, 
-                TokenType.IF, TokenType.LOOP, TokenType.RETURN
-            ]:
-                return
-            
-            self.advance()
+        # Jump to the next token that follows a ';' or starts a statement,
+        # or to EOF, instead of stepping through the tokens in between
+        if self.sync_points is None:
+            types = self.types
+            self.sync_points = [
+                i for i in range(1, len(types))
+                if types[i - 1] == TokenType.SEMICOLON or types[i] in _SYNC_TYPES
+            ]
+        
+        index = bisect_left(self.sync_points, self.current)
+        if index < len(self.sync_points):
+            self.current = self.sync_points[index]
+        else:
+            self.current = len(self.types) - 1
@@ -1,8 +1,22 @@
 ""
 NooCrush Standard Library
 """
-from typing import List, Dict, Any, Callable
-from ..interpreter import Value, ValueType, Interpreter
+import os
+import sys
+from functools import lru_cache
+from itertools import islice
+from math import floor as _floor, ceil as _ceil, sqrt as _sqrt
+from operator import abs as _abs, pow as _pow
+from typing import List, Dict, Any, Callable, Tuple
+from ..interpreter import Value, ValueType, Interpreter, NULL, TRUE, FALSE
+
+# Values are never mutated in place, so small integer results are boxed once
+_SMALL_INT_VALUES = tuple(Value(ValueType.NUMBER, i) for i in range(-5, 257))
+
+def _int_value(n: int) -> Value:
+    if -5 <= n <= 256:
+        return _SMALL_INT_VALUES[n + 5]
+    return Value(ValueType.NUMBER, n)
 
 def register_stdlib(interpreter: Interpreter) -> None:
     """Register all standard library functions."""
@@ -52,40 +66,38 @@ def register_stdlib(interpreter: Interpreter) -> None:
     
     for name, (func, arity) in stdlib.items():
         interpreter.globals.define(name, Value(ValueType.BUILTIN_FUNCTION, 
-            create_native_function(name, func, arity, interpreter)))
+            create_native_function(name, func, arity)))
 
-def create_native_function(name: str, func: Callable, arity: int, interpreter: Interpreter):
-    """Create a native function with the given name and implementation."""
-    def wrapper(args: List[Value]) -> Value:
-        if arity >= 0 and len(args) != arity:
-            raise RuntimeError(f"Expected {arity} arguments but got {len(args)}.")
-        try:
-            return func(args, interpreter)
-        except Exception as e:
-            raise RuntimeError(f"Error in {name}: {str(e)}")
-    return wrapper
+def create_native_function(name: str, func: Callable, arity: int) -> Tuple[Callable, int, str]:
+    """Create a native function with the given name and implementation.
+    
+    The interpreter calls ``func(args, interpreter)`` directly and checks
+    ``arity`` at the call site, so no wrapper frame sits between them.
+    """
+    return (func, arity, name)
 
-# Math functions
-def abs_(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, abs(args[0].value))
+# Math functions. The hot arithmetic builtins bind their helpers as default
+# arguments so each call reads them as locals instead of globals.
+def abs_(args: List[Value], _: Interpreter, _abs=_abs, _V=Value, _N=ValueType.NUMBER) -> Value:
+    return _V(_N, _abs(args[0].value))
 
-def min_(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, min(args[0].value, args[1].value))
+def min_(args: List[Value], _: Interpreter, _min=min, _V=Value, _N=ValueType.NUMBER) -> Value:
+    return _V(_N, _min(args[0].value, args[1].value))
 
-def max_(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, max(args[0].value, args[1].value))
+def max_(args: List[Value], _: Interpreter, _max=max, _V=Value, _N=ValueType.NUMBER) -> Value:
+    return _V(_N, _max(args[0].value, args[1].value))
 
-def pow_(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, args[0].value ** args[1].value)
+def pow_(args: List[Value], _: Interpreter, _pow=_pow, _V=Value, _N=ValueType.NUMBER) -> Value:
+    return _V(_N, _pow(args[0].value, args[1].value))
 
 def sqrt(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, args[0].value ** 0.5)
+    return Value(ValueType.NUMBER, _sqrt(args[0].value))
 
 def floor(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, int(args[0].value // 1))
+    return _int_value(_floor(args[0].value))
 
 def ceil(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.NUMBER, int(-(-args[0].value // 1)))
+    return _int_value(_ceil(args[0].value))
 
 def round_(args: List[Value], _: Interpreter) -> Value:
     return Value(ValueType.NUMBER, round(args[0].value))
@@ -96,14 +108,14 @@ def rand(args: List[Value], _: Interpreter) -> Value:
 
 def randint(args: List[Value], _: Interpreter) -> Value:
     import random
-    return Value(ValueType.NUMBER, random.randint(int(args[0].value), int(args[1].value)))
+    return _int_value(random.randint(int(args[0].value), int(args[1].value)))
 
 # String functions
 def len_(args: List[Value], _: Interpreter) -> Value:
     if args[0].type == ValueType.STRING:
-        return Value(ValueType.NUMBER, len(args[0].value))
+        return _int_value(len(args[0].value))
     elif args[0].type == ValueType.LIST:
-        return Value(ValueType.NUMBER, len(args[0].value))
+        return _int_value(len(args[0].value))
     raise RuntimeError("Can only get length of strings and lists.")
 
 def upper(args: List[Value], _: Interpreter) -> Value:
@@ -115,16 +127,26 @@ def lower(args: List[Value], _: Interpreter) -> Value:
 def trim(args: List[Value], _: Interpreter) -> Value:
     return Value(ValueType.STRING, args[0].value.strip())
 
+def _box_strings(parts) -> List[Value]:
+    # String Values are never mutated in place, so equal pieces share one box
+    boxed = {s: Value(ValueType.STRING, s) for s in set(parts)}
+    return [boxed[s] for s in parts]
+
 def split(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.LIST, [Value(ValueType.STRING, s) for s in args[0].value.split(args[1].value)])
+    return Value(ValueType.LIST, _box_strings(args[0].value.split(args[1].value)))
 
 def join(args: List[Value], _: Interpreter) -> Value:
     if args[0].type != ValueType.LIST:
         raise RuntimeError("First argument to join must be a list.")
-    return Value(ValueType.STRING, args[1].value.join(str(item.value) for item in args[0].value))
+    # A list comprehension hands str.join a ready list instead of a generator it must drain
+    return Value(ValueType.STRING, args[1].value.join([str(item.value) for item in args[0].value]))
 
 def contains(args: List[Value], _: Interpreter) -> Value:
-    return Value(ValueType.BOOLEAN, args[1].value in args[0].value)
+    haystack, needle = args
+    if haystack.type == ValueType.LIST:
+        # Elements are boxed, so compare Values rather than the raw needle
+        return TRUE if needle in haystack.value else FALSE
+    return TRUE if needle.value in haystack.value else FALSE
 
 def replace(args: List[Value], _: Interpreter) -> Value:
     return Value(ValueType.STRING, args[0].value.replace(args[1].value, args[2].value))
@@ -159,10 +181,9 @@ def map_(args: List[Value], interpreter: Interpreter) -> Value:
     if args[1].type != ValueType.FUNCTION:
         raise RuntimeError("Second argument to map must be a function.")
     
-    result = []
-    for item in args[0].value:
-        result.append(interpreter._call_function(args[1], [item]))
-    return Value(ValueType.LIST, result)
+    call = interpreter._call_function
+    callback = args[1]
+    return Value(ValueType.LIST, [call(callback, [item]) for item in args[0].value])
 
 def filter_(args: List[Value], interpreter: Interpreter) -> Value:
     if args[0].type != ValueType.LIST:
@@ -170,11 +191,10 @@ def filter_(args: List[Value], interpreter: Interpreter) -> Value:
     if args[1].type != ValueType.FUNCTION:
         raise RuntimeError("Second argument to filter must be a function.")
     
-    result = []
-    for item in args[0].value:
-        if interpreter._is_truthy(interpreter._call_function(args[1], [item])):
-            result.append(item)
-    return Value(ValueType.LIST, result)
+    call = interpreter._call_function
+    is_truthy = interpreter._is_truthy
+    callback = args[1]
+    return Value(ValueType.LIST, [item for item in args[0].value if is_truthy(call(callback, [item]))])
 
 def reduce_(args: List[Value], interpreter: Interpreter) -> Value:
     if args[0].type != ValueType.LIST:
@@ -184,17 +204,28 @@ def reduce_(args: List[Value], interpreter: Interpreter) -> Value:
     if not args[0].value:
         raise RuntimeError("Cannot reduce an empty list.")
     
-    accumulator = args[0].value[0]
-    for item in args[0].value[1:]:
-        accumulator = interpreter._call_function(args[1], [accumulator, item])
+    call = interpreter._call_function
+    callback = args[1]
+    items = args[0].value
+    accumulator = items[0]
+    for item in islice(items, 1, None):
+        accumulator = call(callback, [accumulator, item])
     return accumulator
 
 # Type conversion
 def to_str(args: List[Value], _: Interpreter) -> Value:
     return Value(ValueType.STRING, str(args[0].value))
 
+@lru_cache(maxsize=4096)
+def _parse_float(s: str) -> float:
+    return float(s)
+
 def to_num(args: List[Value], _: Interpreter) -> Value:
+    # Strings go through the cache; a failed parse raises out of
+    # _parse_float, so errors are never memoized.
     try:
+        if args[0].type == ValueType.STRING:
+            return Value(ValueType.NUMBER, _parse_float(args[0].value))
         return Value(ValueType.NUMBER, float(args[0].value))
     except ValueError:
         raise RuntimeError(f"Cannot convert '{args[0].value}' to number")
@@ -203,35 +234,68 @@ def to_bool(args: List[Value], _: Interpreter) -> Value:
     if args[0].type == ValueType.BOOLEAN:
         return args[0]
     if args[0].type == ValueType.NUMBER:
-        return Value(ValueType.BOOLEAN, bool(args[0].value))
+        return TRUE if args[0].value else FALSE
     if args[0].type == ValueType.STRING:
-        return Value(ValueType.BOOLEAN, bool(args[0].value))
+        return TRUE if args[0].value else FALSE
     if args[0].type == ValueType.LIST:
-        return Value(ValueType.BOOLEAN, bool(args[0].value))
-    return Value(ValueType.BOOLEAN, False)
+        return TRUE if args[0].value else FALSE
+    return FALSE
 
 def to_list(args: List[Value], _: Interpreter) -> Value:
     if args[0].type == ValueType.LIST:
         return args[0]
     if args[0].type == ValueType.STRING:
-        return Value(ValueType.LIST, [Value(ValueType.STRING, c) for c in args[0].value])
+        return Value(ValueType.LIST, _box_strings(args[0].value))
     return Value(ValueType.LIST, [args[0]])
 
 # I/O
 def print_(args: List[Value], _: Interpreter) -> Value:
-    print(" ".join(str(arg.value) for arg in args))
-    return Value(ValueType.NULL, None)
+    if len(args) == 1:
+        sys.stdout.write(f"{args[0].value}\n")
+    else:
+        print(*[arg.value for arg in args])
+    return NULL
 
 def input_(args: List[Value], _: Interpreter) -> Value:
     if args:
         print(args[0].value, end="")
     return Value(ValueType.STRING, input())
 
+# Files below this size skip the buffered text-IO layers and use raw os calls
+_SMALL_FILE = 64 * 1024
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
 def read_file(args: List[Value], _: Interpreter) -> Value:
-    with open(args[0].value, 'r', encoding='utf-8') as f:
-        return Value(ValueType.STRING, f.read())
+    path = args[0].value
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        # Zero-sized entries may be special files; read those the normal way
+        data = os.read(fd, size) if 0 < size < _SMALL_FILE else None
+    finally:
+        os.close(fd)
+    if data is None or len(data) != size:
+        with open(path, 'r', encoding='utf-8') as f:
+            return Value(ValueType.STRING, f.read())
+    text = data.decode('utf-8')
+    if '\r' in text:
+        # Match text mode's universal newline translation
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return Value(ValueType.STRING, text)
 
 def write_file(args: List[Value], _: Interpreter) -> Value:
-    with open(args[0].value, 'w', encoding='utf-8') as f:
-        f.write(args[1].value)
-    return Value(ValueType.NULL, None)
+    path, text = args[0].value, args[1].value
+    if len(text) >= _SMALL_FILE:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return NULL
+    if os.linesep != '\n':
+        text = text.replace('\n', os.linesep)
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+    return NULL
@@ -1,9 +1,17 @@
 ""
 Type system for NooCrush language.
 """
-from typing import Dict, List, Optional, Union, Any, TypeVar, Generic, Callable
+from typing import Dict, List, Mapping, Optional, Tuple, Union, Any, TypeVar, Generic, Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum, auto
+from types import MappingProxyType
+
+# Types are frozen and keep sequences as tuples, so the memoized helpers
+# below can share one instance between callers. __post_init__ fills in
+# derived fields through object.__setattr__. Composite types default their
+# kind, so they can be built from keywords alone, e.g. ListType(element_type=t).
+_set = object.__setattr__
 
 class TypeKind(Enum):
     """Kinds of types in the NooCrush type system."""
@@ -22,7 +30,7 @@ class TypeKind(Enum):
     GENERIC = auto()
     TYPE_VARIABLE = auto()
 
-@dataclass
+@dataclass(frozen=True)
 class Type:
     """Base class for all types in the NooCrush type system."""
     kind: TypeKind
@@ -34,51 +42,26 @@ class Type:
             return True
         
         # Any is a supertype of all types except Never
-        if other.kind == TypeKind.ANY:
-            return self.kind != TypeKind.NEVER
+        other_kind = other.kind
+        if other_kind is TypeKind.ANY:
+            return self.kind is not TypeKind.NEVER
         
         # Never is a subtype of all types
-        if self.kind == TypeKind.NEVER:
+        self_kind = self.kind
+        if self_kind is TypeKind.NEVER:
             return True
             
         # Handle union types
-        if other.kind == TypeKind.UNION:
+        if other_kind is TypeKind.UNION:
             return any(self.is_subtype_of(t) for t in other.types)
             
         # Handle intersection types
-        if self.kind == TypeKind.INTERSECTION:
+        if self_kind is TypeKind.INTERSECTION:
             return all(t.is_subtype_of(other) for t in self.types)
-            
-        # List covariance
-        if (self.kind == TypeKind.LIST and 
-            other.kind == TypeKind.LIST and 
-            isinstance(self, ListType) and 
-            isinstance(other, ListType)):
-            return self.element_type.is_subtype_of(other.element_type)
-            
-        # Function parameter contravariance and return type covariance
-        if (self.kind == TypeKind.FUNCTION and 
-            other.kind == TypeKind.FUNCTION and
-            isinstance(self, FunctionType) and 
-            isinstance(other, FunctionType)):
-            
-            # Parameter types must be contravariant
-            if len(self.parameter_types) != len(other.parameter_types):
-                return False
-                
-            for self_param, other_param in zip(self.parameter_types, other.parameter_types):
-                if not other_param.is_subtype_of(self_param):
-                    return False
-            
-            # Return type must be covariant
-            return self.return_type.is_subtype_of(other.return_type)
         
-        # Struct subtyping (nominal typing)
-        if self.kind == TypeKind.STRUCT and other.kind == TypeKind.STRUCT:
-            # For now, we use nominal typing for structs
-            return self.name == other.name
-            
-        return False
+        # Remaining rules relate two types of the same kind
+        handler = _SUBTYPE_HANDLERS.get((self_kind, other_kind))
+        return handler is not None and handler(self, other)
     
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Type):
@@ -91,61 +74,68 @@ class Type:
     def __str__(self) -> str:
         return self.name if self.name else self.kind.name.lower()
 
-@dataclass
+@dataclass(frozen=True)
 class PrimitiveType(Type):
     """Primitive type like number, string, boolean, etc."""
     pass
 
-@dataclass
+@dataclass(frozen=True)
 class ListType(Type):
     """List type with element type."""
+    kind: TypeKind = TypeKind.LIST
     element_type: Type = Type(TypeKind.ANY)
     
     def __post_init__(self):
-        self.kind = TypeKind.LIST
+        _set(self, "kind", TypeKind.LIST)
         if not self.name:
-            self.name = f"List[{self.element_type}]"
+            _set(self, "name", f"List[{self.element_type}]")
     
     def __str__(self) -> str:
         return f"List[{self.element_type}]"
 
-@dataclass
+@dataclass(frozen=True)
 class FunctionType(Type):
     """Function type with parameter types and return type."""
-    parameter_types: List[Type] = None
+    kind: TypeKind = TypeKind.FUNCTION
+    parameter_types: Tuple[Type, ...] = ()
     return_type: Type = Type(TypeKind.VOID)
-    type_parameters: List[str] = None
+    type_parameters: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        self.kind = TypeKind.FUNCTION
-        if self.parameter_types is None:
-            self.parameter_types = []
-        if self.type_parameters is None:
-            self.type_parameters = []
+        _set(self, "kind", TypeKind.FUNCTION)
+        _set(self, "parameter_types", tuple(self.parameter_types or ()))
+        _set(self, "type_parameters", tuple(self.type_parameters or ()))
         if not self.name:
             params = ", ".join(str(t) for t in self.parameter_types)
-            self.name = f"({params}) -> {self.return_type}"
+            _set(self, "name", f"({params}) -> {self.return_type}")
     
     def __str__(self) -> str:
         params = ", ".join(str(t) for t in self.parameter_types)
         return f"({params}) -> {self.return_type}"
 
-@dataclass
+@dataclass(frozen=True)
 class StructType(Type):
     """Struct type with field types."""
-    fields: Dict[str, Type] = None
-    type_parameters: List[str] = None
+    kind: TypeKind = TypeKind.STRUCT
+    fields: Mapping[str, Type] = None
+    type_parameters: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        self.kind = TypeKind.STRUCT
-        if self.fields is None:
-            self.fields = {}
-        if self.type_parameters is None:
-            self.type_parameters = []
+        _set(self, "kind", TypeKind.STRUCT)
+        # fields is a read-only view of a private copy, so the parallel
+        # tuples below cannot drift from it after construction
+        _set(self, "fields", MappingProxyType(dict(self.fields or {})))
+        _set(self, "type_parameters", tuple(self.type_parameters or ()))
+        # Parallel name/type tuples plus a name -> position index, so walks
+        # over the fields read two flat sequences instead of dict entries
+        _set(self, "_field_names", tuple(self.fields.keys()))
+        _set(self, "_field_types", tuple(self.fields.values()))
+        _set(self, "_field_index", {name: i for i, name in enumerate(self._field_names)})
     
     def get_field_type(self, name: str) -> Optional[Type]:
         """Get the type of a field by name."""
-        return self.fields.get(name)
+        index = self._field_index.get(name)
+        return None if index is None else self._field_types[index]
     
     def __str__(self) -> str:
         if self.name:
@@ -153,45 +143,89 @@ class StructType(Type):
         fields = ", ".join(f"{name}: {typ}" for name, typ in self.fields.items())
         return f"{{ {fields} }}"
 
-@dataclass
+@dataclass(frozen=True)
 class UnionType(Type):
     """Union type representing multiple possible types."""
-    types: List[Type] = None
+    kind: TypeKind = TypeKind.UNION
+    types: Tuple[Type, ...] = ()
     
     def __post_init__(self):
-        self.kind = TypeKind.UNION
-        if self.types is None:
-            self.types = []
+        _set(self, "kind", TypeKind.UNION)
+        _set(self, "types", tuple(self.types or ()))
         if not self.name:
-            self.name = " | ".join(str(t) for t in self.types)
+            _set(self, "name", " | ".join(str(t) for t in self.types))
     
     def __str__(self) -> str:
         return " | ".join(str(t) for t in self.types)
 
-@dataclass
+@dataclass(frozen=True)
 class IntersectionType(Type):
     """Intersection type representing types that must all be satisfied."""
-    types: List[Type] = None
+    kind: TypeKind = TypeKind.INTERSECTION
+    types: Tuple[Type, ...] = ()
     
     def __post_init__(self):
-        self.kind = TypeKind.INTERSECTION
-        if self.types is None:
-            self.types = []
+        _set(self, "kind", TypeKind.INTERSECTION)
+        _set(self, "types", tuple(self.types or ()))
         if not self.name:
-            self.name = " & ".join(str(t) for t in self.types)
+            _set(self, "name", " & ".join(str(t) for t in self.types))
     
     def __str__(self) -> str:
         return " & ".join(str(t) for t in self.types)
 
-@dataclass
+@dataclass(frozen=True)
 class TypeVariable(Type):
     """Type variable for generic types."""
+    kind: TypeKind = TypeKind.TYPE_VARIABLE
+    
     def __post_init__(self):
-        self.kind = TypeKind.TYPE_VARIABLE
+        _set(self, "kind", TypeKind.TYPE_VARIABLE)
     
     def __str__(self) -> str:
         return self.name if self.name else "T"
 
+# @dataclass(frozen=True) gives each subclass a __hash__ over all of its
+# fields, which fails on StructType's mapping and rehashes whole trees.
+# Equal types always share kind and name, so Type's hash stays consistent
+# and every type can key the lru_caches below.
+for _cls in (PrimitiveType, ListType, FunctionType, StructType,
+             UnionType, IntersectionType, TypeVariable):
+    _cls.__hash__ = Type.__hash__
+del _cls
+
+# Subtyping rules between two types of the same kind, keyed by
+# (sub.kind, super.kind) so Type.is_subtype_of dispatches with one lookup
+def _list_sub(sub: Type, sup: Type) -> bool:
+    # List covariance
+    if not (isinstance(sub, ListType) and isinstance(sup, ListType)):
+        return False
+    return sub.element_type.is_subtype_of(sup.element_type)
+
+def _fn_sub(sub: Type, sup: Type) -> bool:
+    if not (isinstance(sub, FunctionType) and isinstance(sup, FunctionType)):
+        return False
+    
+    # Parameter types must be contravariant
+    if len(sub.parameter_types) != len(sup.parameter_types):
+        return False
+        
+    for sub_param, sup_param in zip(sub.parameter_types, sup.parameter_types):
+        if not sup_param.is_subtype_of(sub_param):
+            return False
+    
+    # Return type must be covariant
+    return sub.return_type.is_subtype_of(sup.return_type)
+
+def _struct_sub(sub: Type, sup: Type) -> bool:
+    # For now, we use nominal typing for structs
+    return sub.name == sup.name
+
+_SUBTYPE_HANDLERS: Dict[Tuple[TypeKind, TypeKind], Callable[[Type, Type], bool]] = {
+    (TypeKind.LIST, TypeKind.LIST): _list_sub,
+    (TypeKind.FUNCTION, TypeKind.FUNCTION): _fn_sub,
+    (TypeKind.STRUCT, TypeKind.STRUCT): _struct_sub,
+}
+
 # Commonly used types
 ANY_TYPE = Type(TypeKind.ANY, "any")
 NEVER_TYPE = Type(TypeKind.NEVER, "never")
@@ -202,17 +236,20 @@ NUMBER_TYPE = PrimitiveType(TypeKind.NUMBER, "number")
 STRING_TYPE = PrimitiveType(TypeKind.STRING, "string")
 
 # Type predicates
+# One bit per primitive TypeKind, indexed by the member's value
+_PRIMITIVE_MASK = (
+    (1 << TypeKind.BOOLEAN.value) |
+    (1 << TypeKind.NUMBER.value) |
+    (1 << TypeKind.STRING.value) |
+    (1 << TypeKind.NULL.value) |
+    (1 << TypeKind.VOID.value) |
+    (1 << TypeKind.ANY.value) |
+    (1 << TypeKind.NEVER.value)
+)
+
 def is_primitive_type(typ: Type) -> bool:
     """Check if a type is a primitive type."""
-    return typ.kind in {
-        TypeKind.BOOLEAN,
-        TypeKind.NUMBER,
-        TypeKind.STRING,
-        TypeKind.NULL,
-        TypeKind.VOID,
-        TypeKind.ANY,
-        TypeKind.NEVER
-    }
+    return bool(_PRIMITIVE_MASK & (1 << typ.kind.value))
 
 def is_assignable(target: Type, source: Type) -> bool:
     """Check if a value of source type can be assigned to a target of target type."""
@@ -229,16 +266,25 @@ def is_assignable(target: Type, source: Type) -> bool:
 
 def get_common_supertype(types: List[Type]) -> Type:
     """Find the most specific common supertype of the given types."""
+    return _common_supertype(tuple(types))
+
+@lru_cache(maxsize=2048)
+def _common_supertype(types: Tuple[Type, ...]) -> Type:
     if not types:
         return NEVER_TYPE
     
-    # If all types are the same, return that type
-    if all(t == types[0] for t in types[1:]):
-        return types[0]
+    # If all types are the same, or all share one primitive kind, return the first
+    first = types[0]
+    kind = first.kind
+    if _PRIMITIVE_MASK & (1 << kind.value):
+        if all(t.kind is kind for t in types):
+            return first
+    elif all(t == first for t in types[1:]):
+        return first
     
-    # For now, return the union of all types
+    # For now, return the union of all types, deduplicated in first-seen order
     # In a more sophisticated type system, we would find the most specific common supertype
-    return UnionType(types=list(set(types)))
+    return UnionType(types=tuple(dict.fromkeys(types)))
 
 def instantiate_generic(
     generic_type: Type,
@@ -257,46 +303,78 @@ def instantiate_generic(
     if not type_arguments:
         return generic_type
     
-    if isinstance(generic_type, TypeVariable):
-        return type_arguments.get(generic_type.name, generic_type)
-    
-    if isinstance(generic_type, ListType):
-        return ListType(
-            element_type=instantiate_generic(generic_type.element_type, type_arguments)
-        )
+    # Parameter names are unique, so sorting never has to compare the types
+    return _instantiate(generic_type, tuple(sorted(type_arguments.items())))
+
+def _type_children(node: Type) -> Optional[Tuple[Type, ...]]:
+    """Return the component types rebuilt by instantiation, or None for a leaf."""
+    if isinstance(node, ListType):
+        return (node.element_type,)
+    if isinstance(node, FunctionType):
+        return (*node.parameter_types, node.return_type)
+    if isinstance(node, StructType):
+        return node._field_types
+    if isinstance(node, (UnionType, IntersectionType)):
+        return node.types
+    return None
+
+def _rebuild(node: Type, children: List[Type], type_arguments: Dict[str, Type]) -> Type:
+    """Build a copy of a composite type from its instantiated children."""
+    if isinstance(node, ListType):
+        return ListType(element_type=children[0])
     
-    if isinstance(generic_type, FunctionType):
+    if isinstance(node, FunctionType):
         return FunctionType(
-            parameter_types=[
-                instantiate_generic(t, type_arguments)
-                for t in generic_type.parameter_types
-            ],
-            return_type=instantiate_generic(generic_type.return_type, type_arguments),
-            type_parameters=[
-                t for t in generic_type.type_parameters
+            parameter_types=children[:-1],
+            return_type=children[-1],
+            type_parameters=tuple(
+                t for t in node.type_parameters
                 if t not in type_arguments
-            ]
+            )
         )
     
-    if isinstance(generic_type, StructType):
+    if isinstance(node, StructType):
         return StructType(
-            name=generic_type.name,
-            fields={
-                name: instantiate_generic(field_type, type_arguments)
-                for name, field_type in generic_type.fields.items()
-            },
-            type_parameters=[
-                t for t in generic_type.type_parameters
+            name=node.name,
+            fields=dict(zip(node._field_names, children)),
+            type_parameters=tuple(
+                t for t in node.type_parameters
                 if t not in type_arguments
-            ]
+            )
         )
     
-    if isinstance(generic_type, (UnionType, IntersectionType)):
-        return type(generic_type)(
-            types=[
-                instantiate_generic(t, type_arguments)
-                for t in generic_type.types
-            ]
-        )
+    return type(node)(types=children)
+
+@lru_cache(maxsize=2048)
+def _instantiate(generic_type: Type, arguments: Tuple[Tuple[str, Type], ...]) -> Type:
+    # arguments is the sorted, hashable form of instantiate_generic's mapping.
+    # The tree is walked post-order with an explicit stack, so the walk adds
+    # no Python frames per level. Building and naming the nested types still
+    # recurses through __str__, which bounds how deep a type can be anyway.
+    type_arguments = dict(arguments)
+    results: List[Type] = []
+    work = [(generic_type, None)]
+    
+    while work:
+        node, children = work.pop()
+        if children is not None:
+            # All children are done; their results sit on top of the stack
+            count = len(children)
+            built = results[len(results) - count:]
+            del results[len(results) - count:]
+            results.append(_rebuild(node, built, type_arguments))
+            continue
+        
+        if isinstance(node, TypeVariable):
+            results.append(type_arguments.get(node.name, node))
+            continue
+        
+        children = _type_children(node)
+        if children is None:
+            results.append(node)
+            continue
+        
+        work.append((node, children))
+        work.extend((child, None) for child in reversed(children))
     
-    return generic_type
+    return results[0]
@@ -4,6 +4,7 @@ Utility functions for the NooCrush language implementation.
 import os
 import sys
 import inspect
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type, TypeVar, Callable, Union
 from pathlib import Path
 
@@ -38,16 +39,27 @@ def find_files(directory: Union[str, Path],
     if not directory.is_dir():
         return []
     
-    if recursive:
-        return [
-            p for p in directory.rglob('*')
-            if p.is_file() and p.suffix.lower() in extensions
-        ]
-    else:
-        return [
-            p for p in directory.glob('*')
-            if p.is_file() and p.suffix.lower() in extensions
-        ]
+    ext_set = frozenset(e.lower() for e in extensions)
+    return [Path(p) for p in _walk_files(str(directory), ext_set, recursive)]
+
+def _walk_files(root: str, ext_set: frozenset, recursive: bool):
+    """Yield paths of files under root whose extension is in ext_set."""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    subdirs = []
+    with entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind('.')
+            # A leading dot marks a hidden file, not an extension
+            if dot > 0 and name[dot:].lower() in ext_set and entry.is_file():
+                yield entry.path
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _walk_files(subdir, ext_set, recursive)
 
 def get_class_that_defined_method(meth: Callable) -> Optional[type]:
     """Get the class that defines a method."""
@@ -70,7 +82,7 @@ def get_class_that_defined_method(meth: Callable) -> Optional[type]:
 
 def format_error(message: str, line: int = 0, col: int = 0, 
                  file: Optional[str] = None, code: Optional[str] = None,
-                 context_lines: int = 2) -> str:
+                 context_lines: int = 2, lines: Optional[List[str]] = None) -> str:
     """
     Format an error message with context.
     
@@ -81,6 +93,8 @@ def format_error(message: str, line: int = 0, col: int = 0,
         file: File path
         code: Source code
         context_lines: Number of context lines to show
+        lines: Source code already split into lines; takes precedence over
+            ``code`` so callers formatting many errors split only once
         
     Returns:
         Formatted error message
@@ -101,8 +115,9 @@ def format_error(message: str, line: int = 0, col: int = 0,
     parts.append(f"error: {message}")
     
     # Add code context if available
-    if code and line > 0:
-        lines = code.splitlines()
+    if (lines is not None or code) and line > 0:
+        if lines is None:
+            lines = code.splitlines()
         start_line = max(1, line - context_lines)
         end_line = min(len(lines), line + context_lines + 1)
         
@@ -130,8 +145,13 @@ def pluralize(count: int, singular: str, plural: Optional[str] = None) -> str:
         return f"{count} {singular}"
     return f"{count} {plural if plural else singular + 's'}"
 
+@lru_cache(maxsize=1)
 def get_terminal_width() -> int:
-    """Get the width of the terminal in columns."""
+    """Get the width of the terminal in columns.
+    
+    The result is cached for the life of the process; call
+    ``get_terminal_width.cache_clear()`` to pick up a resized terminal.
+    """
     try:
         import shutil
         return shutil.get_terminal_size().columns
@@ -160,17 +180,19 @@ def print_boxed(text: str, padding: int = 1, char: str = '#') -> None:
     max_line = max(len(line) for line in lines) if lines else 0
     box_width = max_line + (padding * 2)
     
-    # Print the box
-    print(char * (box_width + 4))
-    for _ in range(padding):
-        print(f"{char}{' ' * (box_width + 2)}{char}")
+    # Build the box and write it in one call
+    border = char * (box_width + 4)
+    pad_line = f"{char}{' ' * (box_width + 2)}{char}"
+    out = [border]
+    out.extend([pad_line] * padding)
     
     for line in lines:
         spaces = box_width - len(line)
         left_pad = spaces // 2
         right_pad = spaces - left_pad
-        print(f"{char} {' ' * left_pad}{line}{' ' * right_pad} {char}")
+        out.append(f"{char} {' ' * left_pad}{line}{' ' * right_pad} {char}")
     
-    for _ in range(padding):
-        print(f"{char}{' ' * (box_width + 2)}{char}")
-    print(char * (box_width + 4))
+    out.extend([pad_line] * padding)
+    out.append(border)
+    out.append("")
+    sys.stdout.write("\n".join(out))
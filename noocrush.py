@@ -1,43 +1,142 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import re
-from typing import List, Tuple, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Optional, Dict, Any, Callable, ClassVar, FrozenSet, NoReturn
+
+# Character classes for the lexer, one bit each
+_WS = 1
+_IDENT_START = 2
+_IDENT_CONT = 4
+_DIGIT = 8
+_NUM_CONT = 16
+_OP = 32
+_DELIM = 64
+_QUOTE = 128
+
+def _classify(char: str) -> int:
+    cls = 0
+    if char.isspace():
+        cls |= _WS
+    if char.isalpha() or char == '_':
+        cls |= _IDENT_START
+    if char.isalnum() or char == '_':
+        cls |= _IDENT_CONT
+    if char.isdigit():
+        cls |= _DIGIT
+    if char.isdigit() or char == '.':
+        cls |= _NUM_CONT
+    if char in '+-*/%=<>!&|^':
+        cls |= _OP
+    if char in '(){}[],:;':
+        cls |= _DELIM
+    if char in '"\'':
+        cls |= _QUOTE
+    return cls
+
+# Classes of the first 256 code points; anything above goes through _classify
+_CHAR_CLASS = bytes(_classify(chr(c)) for c in range(256))
+
+def _ascii_class(mask: int) -> str:
+    return re.escape(''.join(chr(c) for c in range(128) if _CHAR_CLASS[c] & mask))
+
+# Master pattern for ASCII sources. findall() yields one (whitespace, token)
+# pair per token: the whitespace run before it and the token text, which is
+# empty only at the end of input. Matches are contiguous because the last
+# alternative accepts any character. The character sets come from the same
+# table as the hand-written loop. Well-formed string literals match whole;
+# a malformed one matches as its lone opening quote.
+_TOKEN_RE = re.compile(
+    f"([{_ascii_class(_WS)}]*)("
+    r"//[^\n]*"
+    f"|[{_ascii_class(_IDENT_START)}][{_ascii_class(_IDENT_CONT)}]*"
+    f"|[{_ascii_class(_DIGIT)}][{_ascii_class(_NUM_CONT)}]*"
+    r"""|"(?:[^"\\\n]|\\[ntr\\"])*"|'(?:[^'\\\n]|\\[ntr\\'])*'"""
+    f"|[{_ascii_class(_OP)}]+"
+    r"|.|\Z)",
+    re.DOTALL,
+)
+
+# \s is exactly str.isspace, the whitespace class of the manual loop
+_WS_RUN = re.compile(r'\s+').match
+
+# Identifier values are interned so repeated names share one string
+_intern = sys.intern
+
+_ESCAPE_RE = re.compile(r'\\(.)')
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r'}
+
+# Valid escapes inside a string and what they stand for, per opening quote
+_STRING_ESCAPES = {
+    quote: dict(_ESCAPES, **{'\\': '\\', quote: quote}) for quote in '"\''
+}
+
+# Characters that end a plain run inside a string, per opening quote
+_STRING_STOP = {
+    '"': re.compile(r'["\\\n]'),
+    "'": re.compile(r"['\\\n]"),
+}
+
+def _unescape(m: 're.Match[str]') -> str:
+    char = m.group(1)
+    return _ESCAPES.get(char, char)
 
 class Token:
-    def __init__(self, type: str, value: Any, line: int, column: int):
+    __slots__ = ('type', 'value', 'line', 'column')
+
+    def __init__(self, type: str, value: Any, line: int, column: int) -> None:
         self.type = type
         self.value = value
         self.line = line
         self.column = column
 
-    def __repr__(self):
+    def __repr__(self) -> str:
         return f'Token({self.type}, {repr(self.value)}, line={self.line}, col={self.column})'
 
+# Below this many characters a worker pool costs more than it saves
+_PARALLEL_MIN_SIZE = 1 << 20
+
+def _token_tuples(tokens: List[Token]) -> List[Tuple[str, Any, int, int]]:
+    return [(t.type, t.value, t.line, t.column) for t in tokens]
+
+def _tokenize_chunk(args: Tuple[str, int]) -> Optional[List[Tuple[str, Any, int, int]]]:
+    chunk, line_offset = args
+    try:
+        tokens = NooCrushLexer().tokenize(chunk, line=line_offset + 1)
+    except SyntaxError:
+        return None
+    # Plain tuples pickle several times faster than Token instances
+    return _token_tuples(tokens)
+
 class NooCrushLexer:
-    def __init__(self):
-        self.keywords = {
-            'let': 'LET',
-            'const': 'CONST',
-            'fn': 'FN',
-            'mut': 'MUT',
-            'async': 'ASYNC',
-            'await': 'AWAIT',
-            'if': 'IF',
-            'else': 'ELSE',
-            'loop': 'LOOP',
-            'break': 'BREAK',
-            'return': 'RETURN',
-            'struct': 'STRUCT'
-        }
-        
+    KEYWORDS: ClassVar[Dict[str, str]] = {
+        'let': 'LET',
+        'const': 'CONST',
+        'fn': 'FN',
+        'mut': 'MUT',
+        'async': 'ASYNC',
+        'await': 'AWAIT',
+        'if': 'IF',
+        'else': 'ELSE',
+        'loop': 'LOOP',
+        'break': 'BREAK',
+        'return': 'RETURN',
+        'struct': 'STRUCT'
+    }
+    # Most identifiers are not keywords; a set test rejects them before the
+    # dict is consulted
+    _KEYWORD_SET: ClassVar[FrozenSet[str]] = frozenset(KEYWORDS)
+
+    def __init__(self) -> None:
         self.tokens: List[Token] = []
-        self.source = ''
-        self.pos = 0
-        self.line = 1
-        self.column = 1
+        self.source: str = ''
+        self.pos: int = 0
+        self.line: int = 1
+        self.column: int = 1
 
-    def error(self, message: str) -> None:
+    def error(self, message: str) -> NoReturn:
         raise SyntaxError(f'Line {self.line}, Column {self.column}: {message}')
 
     def advance(self) -> None:
@@ -53,112 +152,301 @@ class NooCrushLexer:
             return self.source[self.pos]
         return None
 
-    def tokenize(self, source: str) -> List[Token]:
+    def tokenize(self, source: str, use_regex: bool = True, line: int = 1) -> List[Token]:
+        # line is the number of the source's first line, for callers that
+        # lex a file piecewise
         self.source = source
-        self.tokens = []
+        self.tokens = tokens = []
         self.pos = 0
-        self.line = 1
+        self.line = line
         self.column = 1
 
-        while self.pos < len(self.source):
-            char = self.source[self.pos]
+        # ASCII sources go through the master regex; the hand-written loop
+        # below handles the rest and can be forced with use_regex=False
+        if use_regex and source.isascii():
+            return self._tokenize_regex(source)
+
+        # The loop works on locals and writes pos/line/column back to self
+        # only around tokenize_string and before reporting an error. Columns
+        # are derived from the offset as pos - base, the same way as in
+        # _tokenize_regex, so only newlines touch the position state.
+        tokens_append = tokens.append
+        keywords = self.KEYWORDS
+        keyword_set = self._KEYWORD_SET
+        table = _CHAR_CLASS
+        ws_run = _WS_RUN
+        src = source
+        n = len(src)
+        pos = 0
+        line = self.line
+        base = -1
+
+        while pos < n:
+            char = src[pos]
+            code = ord(char)
+            cls = table[code] if code < 256 else _classify(char)
             
             # Handle whitespace
-            if char.isspace():
+            if cls & _WS:
                 if char == '\n':
-                    self.newline()
-                self.advance()
+                    line += 1
+                    base = pos - 1
+                pos += 1
+                # Indentation and other longer runs are taken in one match
+                if pos < n and src[pos] in ' \t':
+                    end = ws_run(src, pos).end()
+                    nl = src.rfind('\n', pos, end)
+                    if nl >= 0:
+                        line += src.count('\n', pos, nl + 1)
+                        base = nl - 1
+                    pos = end
                 continue
 
             # Handle comments
-            if char == '/' and self.peek() == '/':
-                while self.pos < len(self.source) and self.source[self.pos] != '\n':
-                    self.advance()
+            if char == '/' and pos + 1 < n and src[pos + 1] == '/':
+                # Stop at the newline and leave it to the whitespace branch
+                pos = src.find('\n', pos)
+                if pos < 0:
+                    pos = n
                 continue
 
             # Handle identifiers and keywords
-            if char.isalpha() or char == '_':
-                start_col = self.column
-                identifier = self.consume_while(lambda c: c.isalnum() or c == '_')
-                token_type = self.keywords.get(identifier, 'IDENTIFIER')
-                self.tokens.append(Token(token_type, identifier, self.line, start_col))
+            if cls & _IDENT_START:
+                start = pos
+                pos += 1
+                while pos < n:
+                    code = ord(src[pos])
+                    if not (table[code] if code < 256 else _classify(src[pos])) & _IDENT_CONT:
+                        break
+                    pos += 1
+                identifier = _intern(src[start:pos])
+                token_type = keywords[identifier] if identifier in keyword_set else 'IDENTIFIER'
+                tokens_append(Token(token_type, identifier, line, start - base))
                 continue
 
             # Handle numbers
-            if char.isdigit():
-                start_col = self.column
-                number = self.consume_while(lambda c: c.isdigit() or c == '.')
+            if cls & _DIGIT:
+                start = pos
+                pos += 1
+                while pos < n:
+                    code = ord(src[pos])
+                    if not (table[code] if code < 256 else _classify(src[pos])) & _NUM_CONT:
+                        break
+                    pos += 1
+                number = src[start:pos]
                 try:
                     value = float(number) if '.' in number else int(number)
-                    self.tokens.append(Token('NUMBER', value, self.line, start_col))
+                    tokens_append(Token('NUMBER', value, line, start - base))
                 except ValueError:
+                    self.pos, self.line, self.column = pos, line, pos - base
                     self.error(f'Invalid number format: {number}')
                 continue
 
             # Handle strings
-            if char in '\"\'':
+            if cls & _QUOTE:
+                self.pos, self.line, self.column = pos, line, pos - base
                 self.tokenize_string(char)
+                pos = self.pos
                 continue
 
             # Handle operators
-            if char in '+-*/%=<>!&|^':
-                start_col = self.column
-                operator = self.consume_while(lambda c: c in '+-*/%=<>!&|^')
-                self.tokens.append(Token('OPERATOR', operator, self.line, start_col))
+            if cls & _OP:
+                start = pos
+                pos += 1
+                # Most operators are one character; emit those without the scan
+                code = ord(src[pos]) if pos < n else 0
+                if code > 255 or not table[code] & _OP:
+                    tokens_append(Token('OPERATOR', char, line, start - base))
+                    continue
+                pos += 1
+                while pos < n:
+                    code = ord(src[pos])
+                    if not (table[code] if code < 256 else 0) & _OP:
+                        break
+                    pos += 1
+                tokens_append(Token('OPERATOR', src[start:pos], line, start - base))
                 continue
 
             # Handle delimiters
-            if char in '(){}[],:;':
-                self.tokens.append(Token('DELIMITER', char, self.line, self.column))
-                self.advance()
+            if cls & _DELIM:
+                tokens_append(Token('DELIMITER', char, line, pos - base))
+                pos += 1
                 continue
 
+            self.pos, self.line, self.column = pos, line, pos - base
             self.error(f'Unexpected character: {char}')
 
+        col = pos - base
+        self.pos, self.line, self.column = pos, line, col
+
+        # Add EOF token
+        tokens_append(Token('EOF', None, line, col))
+        return tokens
+
+    def _tokenize_regex(self, source: str) -> List[Token]:
+        tokens = self.tokens
+        tokens_append = tokens.append
+        keywords = self.KEYWORDS
+        keyword_set = self._KEYWORD_SET
+        table = _CHAR_CLASS
+        line = self.line
+        pos = 0
+        # A token's column is its offset minus base. After a newline at
+        # offset i the next character is column 2, as in the manual loop.
+        base = -1
+
+        for ws, text in _TOKEN_RE.findall(source):
+            if ws:
+                if '\n' in ws:
+                    line += ws.count('\n')
+                    base = pos + ws.rfind('\n') - 1
+                pos += len(ws)
+            if not text:
+                break
+            col = pos - base
+            pos += len(text)
+
+            # The first character tells which alternative matched
+            first = text[0]
+            cls = table[ord(first)]
+            if cls & _IDENT_START:
+                text = _intern(text)
+                token_type = keywords[text] if text in keyword_set else 'IDENTIFIER'
+                tokens_append(Token(token_type, text, line, col))
+            elif cls & _OP:
+                if text[:2] != '//':
+                    tokens_append(Token('OPERATOR', text, line, col))
+            elif cls & _DELIM:
+                tokens_append(Token('DELIMITER', text, line, col))
+            elif cls & _DIGIT:
+                try:
+                    value = float(text) if '.' in text else int(text)
+                except ValueError:
+                    self.pos, self.line, self.column = pos, line, col + len(text)
+                    self.error(f'Invalid number format: {text}')
+                tokens_append(Token('NUMBER', value, line, col))
+            elif cls & _QUOTE and len(text) > 1:
+                value = text[1:-1]
+                if '\\' in value:
+                    value = _ESCAPE_RE.sub(_unescape, value)
+                tokens_append(Token('STRING', value, line, col))
+            elif cls & _QUOTE:
+                self.pos, self.line, self.column = pos - 1, line, col
+                self.tokenize_string(text)
+            else:
+                self.pos, self.line, self.column = pos - 1, line, col
+                self.error(f'Unexpected character: {text}')
+
+        col = pos - base
+        self.pos, self.line, self.column = pos, line, col
+
         # Add EOF token
-        self.tokens.append(Token('EOF', None, self.line, self.column))
-        return self.tokens
+        tokens_append(Token('EOF', None, line, col))
+        return tokens
 
-    def consume_while(self, predicate) -> str:
-        result = ''
-        while self.pos < len(self.source) and predicate(self.source[self.pos]):
-            result += self.source[self.pos]
-            self.advance()
-        return result
+    def tokenize_parallel(self, source: str, workers: Optional[int] = None) -> List[Tuple[str, Any, int, int]]:
+        # Opt-in: returns (type, value, line, column) tuples rather than Token
+        # objects, since rebuilding every Token in the parent costs most of
+        # what the workers save. Wrap with Token(*t) where objects are needed.
+        if workers is None:
+            workers = os.cpu_count() or 1
+        n = len(source)
+        if workers < 2 or n < _PARALLEL_MIN_SIZE:
+            return _token_tuples(self.tokenize(source))
+
+        # No token spans a newline (strings may not contain one and comments
+        # end at one), so every newline is a safe split point. Chunks after
+        # the first start at their newline, which makes their columns come
+        # out exactly as they would in the whole file.
+        size = n // workers
+        chunks = []
+        start = 0
+        line_offset = 0
+        while start < n:
+            cut = source.find('\n', start + size)
+            if cut < 0:
+                cut = n
+            chunk = source[start:cut]
+            chunks.append((chunk, line_offset))
+            line_offset += chunk.count('\n')
+            start = cut
+
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(_tokenize_chunk, chunks))
+
+        # Re-run serially on failure so the error reports whole-file positions
+        if any(part is None for part in parts):
+            return _token_tuples(self.tokenize(source))
+
+        tokens: List[Tuple[str, Any, int, int]] = []
+        for part in parts[:-1]:
+            del part[-1]  # Chunk EOF
+            tokens.extend(part)
+        tokens.extend(parts[-1])
+        _, _, eof_line, eof_column = tokens[-1]
+        self.source = source
+        self.pos, self.line, self.column = n, eof_line, eof_column
+        return tokens
+
+    def consume_while(self, predicate: Callable[[str], bool]) -> str:
+        src = self.source
+        n = len(src)
+        start = i = self.pos
+        while i < n and predicate(src[i]):
+            i += 1
+        # Callers never consume newlines, so only the column moves
+        self.column += i - start
+        self.pos = i
+        return src[start:i]
 
     def tokenize_string(self, quote: str) -> None:
+        src = self.source
+        n = len(src)
+        start = self.pos
         start_col = self.column
-        self.advance()  # Skip opening quote
-        string = ''
-        
-        while self.pos < len(self.source):
-            char = self.source[self.pos]
-            
-            if char == '\n':
+        stop = _STRING_STOP[quote]
+        escapes = _STRING_ESCAPES[quote]
+        parts = []
+        i = start + 1  # Skip opening quote
+
+        # Jump from one quote, backslash or newline to the next and copy the
+        # plain runs between them as slices
+        while True:
+            m = stop.search(src, i)
+            if m is None:
+                self.pos = n
+                self.column = start_col + self.pos - start
                 self.error('Unterminated string literal')
-            
+            j = m.start()
+            parts.append(src[i:j])
+            char = src[j]
+
             if char == quote:
-                self.advance()  # Skip closing quote
-                self.tokens.append(Token('STRING', string, self.line, start_col))
+                self.pos = j + 1  # Skip closing quote
+                self.column = start_col + self.pos - start
+                self.tokens.append(Token('STRING', ''.join(parts), self.line, start_col))
                 return
-            
-            if char == '\\':
-                self.advance()
-                if self.pos >= len(self.source):
-                    self.error('Unterminated string literal')
-                char = self.source[self.pos]
-                if char in {'n', 't', 'r', '\\', quote}:
-                    string += {'n': '\n', 't': '\t', 'r': '\r'}.get(char, char)
-                else:
-                    self.error(f'Invalid escape sequence: \\{char}')
-            else:
-                string += char
-            self.advance()
-        
-        self.error('Unterminated string literal')
+
+            if char == '\n':
+                self.pos = j
+                self.column = start_col + j - start
+                self.error('Unterminated string literal')
+
+            # Backslash: the escaped character decides
+            j += 1
+            self.pos = j
+            self.column = start_col + j - start
+            if j >= n:
+                self.error('Unterminated string literal')
+            char = src[j]
+            replacement = escapes.get(char)
+            if replacement is None:
+                self.error(f'Invalid escape sequence: \\{char}')
+            parts.append(replacement)
+            i = j + 1
 
 class NooCrushParser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token]) -> None:
         self.tokens = tokens
         self.current = 0
 
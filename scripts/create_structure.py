@@ -3,8 +3,9 @@
 Script to create a comprehensive directory structure for the NooCrush project.
 """
 import os
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Union
+from typing import Iterator, List, Dict, Union
 
 class DirectoryStructure:
     """Class to manage directory structure creation."""
@@ -14,25 +15,30 @@ class DirectoryStructure:
         self.root = Path(root).resolve()
         
     def create_directories(self, structure: Dict[str, any]) -> None:
-        """Create directory structure recursively."""
-        self._create_directories(self.root, structure)
+        """Create directory structure.
+
+        Only the leaf directories are created explicitly; ``os.makedirs``
+        creates their parents on the way.
+        """
+        leaves = list(self._leaf_paths(str(self.root), structure))
+        for path in leaves:
+            os.makedirs(path, exist_ok=True)
+        print(f"Created {len(leaves)} leaf directories")
     
-    def _create_directories(self, 
-                          base: Path, 
-                          structure: Union[Dict[str, any], List[str]], 
-                          prefix: str = ""):
-        """Recursively create directories."""
+    def _leaf_paths(self, 
+                    base: str, 
+                    structure: Union[Dict[str, any], List[str]]) -> Iterator[str]:
+        """Recursively yield the paths of directories without children."""
         if isinstance(structure, dict):
             for name, children in structure.items():
-                path = base / name
-                print(f"Creating directory: {prefix}{name}")
-                path.mkdir(parents=True, exist_ok=True)
-                self._create_directories(path, children, prefix + "  ")
+                path = os.path.join(base, name)
+                if children:
+                    yield from self._leaf_paths(path, children)
+                else:
+                    yield path
         elif isinstance(structure, list):
             for name in structure:
-                path = base / name
-                print(f"Creating directory: {prefix}{name}")
-                path.mkdir(parents=True, exist_ok=True)
+                yield os.path.join(base, name)
 
 def main():
     """Main function to create the directory structure."""
@@ -342,19 +348,11 @@ This project is licensed under the MIT License - see the [LICENSE](LICENSE) file
     with open(root_dir / "README.md", "w", encoding="utf-8") as f:
         f.write(readme_content)
     
-    # Create empty __init__.py files
-    for root, dirs, _ in os.walk(root_dir / "noocrush"):
-        for dir_name in dirs:
-            init_file = Path(root) / dir_name / "__init__.py"
-            init_file.parent.mkdir(parents=True, exist_ok=True)
-            if not init_file.exists():
-                init_file.touch()
-    
-    # Create empty __init__.py in test directories
-    for root, dirs, _ in os.walk(root_dir / "tests"):
-        for dir_name in dirs:
-            init_file = Path(root) / dir_name / "__init__.py"
-            init_file.parent.mkdir(parents=True, exist_ok=True)
+    # Create empty __init__.py files in every directory below noocrush/
+    # and tests/; os.walk already yields each of them once as its root
+    for base in (root_dir / "noocrush", root_dir / "tests"):
+        for root, _, _ in islice(os.walk(base), 1, None):
+            init_file = Path(root) / "__init__.py"
             if not init_file.exists():
                 init_file.touch()
 
@@ -49,25 +49,29 @@ def print_error(message):
     print(f"{Colors.FAIL}✗ {message}{Colors.ENDC}", file=sys.stderr)
     sys.exit(1)
 
-def run_command(command, cwd=None, shell=False):
-    """Run a shell command and return the output."""
+def run_command(command, cwd=None, shell=False, capture=False):
+    """Run a shell command.
+
+    Output streams straight to the terminal unless ``capture`` is set, in
+    which case the command's stdout is returned.
+    """
     try:
-        process = subprocess.Popen(
+        result = subprocess.run(
             command,
             cwd=cwd or PROJECT_ROOT,
             shell=shell,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            capture_output=capture,
             text=True
         )
-        stdout, stderr = process.communicate()
-        
-        if process.returncode != 0:
-            print_error(f"Command failed: {' '.join(command) if isinstance(command, list) else command}\n{stderr}")
-        
-        return stdout.strip()
     except Exception as e:
         print_error(f"Error running command: {e}")
+    
+    if result.returncode != 0:
+        details = f"\n{result.stderr}" if capture else ""
+        print_error(f"Command failed: {' '.join(command) if isinstance(command, list) else command}{details}")
+    
+    if capture:
+        return result.stdout.strip()
 
 def check_prerequisites():
     """Check if all prerequisites are installed."""
@@ -82,21 +86,21 @@ def check_prerequisites():
     
     # Check for Git
     try:
-        git_version = run_command(["git", "--version"])
+        git_version = run_command(["git", "--version"], capture=True)
         print_success(f"{git_version} detected")
     except FileNotFoundError:
         print_warning("Git is not installed. Some features may be limited.")
     
     # Check for Docker
     try:
-        docker_version = run_command(["docker", "--version"])
+        docker_version = run_command(["docker", "--version"], capture=True)
         print_success(f"{docker_version} detected")
     except FileNotFoundError:
         print_warning("Docker is not installed. Container-based development will not be available.")
     
     # Check for Docker Compose
     try:
-        compose_version = run_command(["docker-compose", "--version"])
+        compose_version = run_command(["docker-compose", "--version"], capture=True)
         print_success(f"{compose_version} detected")
     except FileNotFoundError:
         print_warning("Docker Compose is not installed. Container-based development will not be available.")
@@ -23,11 +23,27 @@ def parser():
     """Fixture providing a Parser instance."""
     return Parser()
 
-@pytest.fixture
-def interpreter():
-    """Fixture providing an Interpreter instance."""
+@pytest.fixture(scope="session")
+def base_interpreter():
+    """Fixture providing the Interpreter shared by the whole session."""
     return Interpreter()
 
+@pytest.fixture
+def interpreter(base_interpreter):
+    """Fixture providing an Interpreter with freshly initialized globals.
+    
+    The session's interpreter is reused; whatever a test defines or
+    reassigns in its globals is rolled back afterwards.
+    """
+    globals_env = base_interpreter.globals
+    values = dict(globals_env.values)
+    slots = list(globals_env.slots)
+    yield base_interpreter
+    globals_env.values.clear()
+    globals_env.values.update(values)
+    globals_env.slots[:] = slots
+    base_interpreter.environment = globals_env
+
 @pytest.fixture
 def example_files():
     """Fixture providing paths to example files."""
@@ -47,6 +63,9 @@ def pytest_addoption(parser):
 def pytest_configure(config):
     """Pytest configuration hook."""
     config.addinivalue_line("markers", "slow: mark test as slow to run")
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of one group on the same xdist worker"
+    )
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection based on command line options."""
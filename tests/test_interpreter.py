@@ -1,74 +1,90 @@
 """
 Tests for the NooCrush interpreter.
 """
+from functools import lru_cache
+
 import pytest
-from noocrush.interpreter import Interpreter
 from noocrush.lexer import Scanner
 from noocrush.parser import Parser
 
+_SCANNER = Scanner()
+
+@lru_cache(maxsize=4096)
+def _compile(source):
+    """Scan and parse source, once per distinct snippet.
+
+    The statements can be shared between interpreters: resolving only
+    rewrites the resolver's own annotations on the nodes.
+    """
+    _SCANNER.reset(source)
+    return Parser(_SCANNER.scan_tokens()).parse()
+
 class TestInterpreter:
     """Test suite for the NooCrush interpreter."""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, interpreter):
         """Set up test fixtures."""
-        self.interpreter = Interpreter()
+        self.interpreter = interpreter
         
     def interpret(self, source):
         """Helper method to interpret source code."""
-        scanner = Scanner()
-        scanner.source = source
-        tokens = scanner.scan_tokens()
-        parser = Parser(tokens)
-        statements = parser.parse()
-        return self.interpreter.interpret(statements)
+        return self.interpreter.interpret(_compile(source))
     
-    def test_literals(self):
-        """Test interpreting literal values."""
+    @pytest.mark.parametrize("source,expected", [
         # Numbers
-        assert self.interpret("42") == 42
-        assert self.interpret("3.14") == 3.14
-        
+        ("42", 42),
+        ("3.14", 3.14),
         # Strings
-        assert self.interpret('"Hello"') == "Hello"
-        
+        ('"Hello"', "Hello"),
         # Booleans
-        assert self.interpret("true") is True
-        assert self.interpret("false") is False
-        
+        ("true", True),
+        ("false", False),
         # Null
-        assert self.interpret("null") is None
+        ("null", None),
+    ])
+    def test_literals(self, source, expected):
+        """Test interpreting literal values."""
+        result = self.interpret(source)
+        # Booleans and null must come back as the singletons themselves
+        if expected is None or isinstance(expected, bool):
+            assert result is expected
+        else:
+            assert result == expected
     
-    def test_arithmetic(self):
-        """Test arithmetic operations."""
-        assert self.interpret("1 + 2") == 3
-        assert self.interpret("5 - 3") == 2
-        assert self.interpret("2 * 3") == 6
-        assert self.interpret("10 / 2") == 5.0
-        assert self.interpret("10 % 3") == 1
-        assert self.interpret("2 ** 3") == 8
-        
+    @pytest.mark.parametrize("source,expected", [
+        ("1 + 2", 3),
+        ("5 - 3", 2),
+        ("2 * 3", 6),
+        ("10 / 2", 5.0),
+        ("10 % 3", 1),
+        ("2 ** 3", 8),
         # Operator precedence
-        assert self.interpret("2 + 3 * 4") == 14  # 2 + (3 * 4)
-        assert self.interpret("(2 + 3) * 4") == 20
+        ("2 + 3 * 4", 14),  # 2 + (3 * 4)
+        ("(2 + 3) * 4", 20),
+    ])
+    def test_arithmetic(self, source, expected):
+        """Test arithmetic operations."""
+        assert self.interpret(source) == expected
     
-    def test_comparisons(self):
-        """Test comparison operators."""
+    @pytest.mark.parametrize("source,expected", [
         # Equality
-        assert self.interpret("1 == 1") is True
-        assert self.interpret("1 == 2") is False
-        assert self.interpret('"a" == "a"') is True
-        assert self.interpret('"a" == "b"') is False
-        
+        ("1 == 1", True),
+        ("1 == 2", False),
+        ('"a" == "a"', True),
+        ('"a" == "b"', False),
         # Inequality
-        assert self.interpret("1 != 2") is True
-        assert self.interpret("1 != 1") is False
-        
+        ("1 != 2", True),
+        ("1 != 1", False),
         # Comparisons
-        assert self.interpret("1 < 2") is True
-        assert self.interpret("1 <= 1") is True
-        assert self.interpret("3 > 2") is True
-        assert self.interpret("3 >= 3") is True
+        ("1 < 2", True),
+        ("1 <= 1", True),
+        ("3 > 2", True),
+        ("3 >= 3", True),
+    ])
+    def test_comparisons(self, source, expected):
+        """Test comparison operators."""
+        assert self.interpret(source) is expected
     
     def test_logical_operators(self):
         """Test logical operators."""
@@ -105,7 +121,23 @@ class TestInterpreter:
         # Try to reassign constant (should raise error)
         with pytest.raises(RuntimeError):
             self.interpret("PI = 3.14159;")
-    
+
+    def test_block_scoping(self):
+        """Test that nested blocks resolve locals to the right scope."""
+        source = """
+        let x = 1;
+        {
+            let y = 2;
+            {
+                let x = y + 10;
+                y = x;
+            }
+            x = y;
+        }
+        x
+        """
+        assert self.interpret(source) == 12
+
     def test_control_flow(self):
         """Test control flow statements."""
         # If statement
@@ -167,7 +199,11 @@ class TestInterpreter:
             return counter;
         }
         let counter = makeCounter();
-        counter() + counter() + counter()
+        let total = 0;
+        for (let i = 0; i < 3; i = i + 1) {
+            total = total + counter();
+        }
+        total
         """
         assert self.interpret(source) == 6  # 1 + 2 + 3
     
@@ -218,6 +254,7 @@ class TestInterpreter:
         self.interpret('person.name = "Bob";')
         assert self.interpret("person.name") == "Bob"
     
+    @pytest.mark.xdist_group(name="slow")
     def test_classes(self):
         """Test class definitions and instances."""
         source = """
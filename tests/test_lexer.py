@@ -1,9 +1,24 @@
 """
 Tests for the NooCrush lexer.
 """
+import os
+from time import perf_counter_ns
+
 import pytest
 from noocrush.lexer import Scanner, TokenType
 
+# Expected token type sequence, built once at import
+_EXPECTED_BASIC = (
+    TokenType.LET, TokenType.IDENTIFIER, TokenType.EQUAL, TokenType.NUMBER, TokenType.SEMICOLON,
+    TokenType.CONST, TokenType.IDENTIFIER, TokenType.EQUAL, TokenType.STRING, TokenType.SEMICOLON,
+    TokenType.IF, TokenType.LEFT_PAREN, TokenType.IDENTIFIER, TokenType.GREATER, 
+    TokenType.NUMBER, TokenType.RIGHT_PAREN, TokenType.LEFT_BRACE,
+    TokenType.IDENTIFIER, TokenType.LEFT_PAREN, TokenType.IDENTIFIER, TokenType.RIGHT_PAREN, 
+    TokenType.SEMICOLON,
+    TokenType.RIGHT_BRACE,
+    TokenType.EOF
+)
+
 # Test cases for lexer
 def test_basic_tokens(scanner):
     """Test basic token recognition."""
@@ -18,20 +33,8 @@ def test_basic_tokens(scanner):
     tokens = scanner.scan_tokens()
     
     # Check token types in sequence
-    expected_types = [
-        TokenType.LET, TokenType.IDENTIFIER, TokenType.EQUAL, TokenType.NUMBER, TokenType.SEMICOLON,
-        TokenType.CONST, TokenType.IDENTIFIER, TokenType.EQUAL, TokenType.STRING, TokenType.SEMICOLON,
-        TokenType.IF, TokenType.LEFT_PAREN, TokenType.IDENTIFIER, TokenType.GREATER, 
-        TokenType.NUMBER, TokenType.RIGHT_PAREN, TokenType.LEFT_BRACE,
-        TokenType.IDENTIFIER, TokenType.LEFT_PAREN, TokenType.IDENTIFIER, TokenType.RIGHT_PAREN, 
-        TokenType.SEMICOLON,
-        TokenType.RIGHT_BRACE,
-        TokenType.EOF
-    ]
-    
-    for i, token in enumerate(tokens):
-        if i < len(expected_types):
-            assert token.type == expected_types[i], f"Token {i} type mismatch: {token.type} != {expected_types[i]}"
+    actual_types = tuple(t.type for t in tokens[:len(_EXPECTED_BASIC)])
+    assert actual_types == _EXPECTED_BASIC, f"Token type mismatch: {actual_types} != {_EXPECTED_BASIC}"
 
 def test_number_literals(scanner):
     """Test number literal tokens."""
@@ -69,17 +72,16 @@ def test_operators(scanner):
     scanner.source = source
     tokens = scanner.scan_tokens()
     
-    expected_types = [
+    expected_types = (
         TokenType.PLUS, TokenType.MINUS, TokenType.STAR, TokenType.SLASH, 
         TokenType.PERCENT, TokenType.EQUAL, TokenType.EQUAL_EQUAL, 
         TokenType.BANG_EQUAL, TokenType.LESS, TokenType.LESS_EQUAL,
         TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.BANG,
         TokenType.AND, TokenType.OR, TokenType.EOF
-    ]
+    )
     
-    for i, token in enumerate(tokens):
-        if i < len(expected_types):
-            assert token.type == expected_types[i], f"Token {i} type mismatch: {token.type} != {expected_types[i]}"
+    actual_types = tuple(t.type for t in tokens[:len(expected_types)])
+    assert actual_types == expected_types, f"Token type mismatch: {actual_types} != {expected_types}"
 
 def test_comments(scanner):
     """Test comment handling."""
@@ -102,18 +104,40 @@ def test_comments(scanner):
 
 # Add more test cases for error handling, edge cases, etc.
 
+# Sources for the scaling test, built once at import
+_LARGE_SOURCES = {n: "let x = 42;\n" * n for n in (100, 1000)}
+
+# Time allowed per 1000 source lines (500ms, ~100us/line); scaled to each case
+BUDGET_NS = int(os.environ.get("NOOCRUSH_LEX_BUDGET_NS", 500_000_000))
+
 # Mark slow tests with @pytest.mark.slow
 @pytest.mark.slow
-def test_large_source_file(scanner):
+@pytest.mark.parametrize("lines", sorted(_LARGE_SOURCES))
+@pytest.mark.xdist_group(name="slow")
+def test_large_source_file(scanner, lines):
     """Test lexing a large source file."""
-    source = "let x = 42;\n" * 1000  # 1000 lines of code
-    scanner.source = source
-    tokens = scanner.scan_tokens()
+    source = _LARGE_SOURCES[lines]
+    # The token stream keeps types in an int array; count them there
+    # instead of materializing Token objects. The fastest of a few scans is
+    # timed so a busy xdist worker does not trip the budget on its own.
+    elapsed_ns = None
+    for _ in range(3):
+        scanner.reset(source)
+        t0 = perf_counter_ns()
+        types = scanner.scan_token_stream().types
+        elapsed = perf_counter_ns() - t0
+        if elapsed_ns is None or elapsed < elapsed_ns:
+            elapsed_ns = elapsed
+    
+    # Should have one LET, IDENTIFIER, EQUAL, NUMBER and SEMICOLON per line, then EOF
+    assert types.count(TokenType.LET) == lines
+    assert types.count(TokenType.IDENTIFIER) == lines
+    assert types.count(TokenType.EQUAL) == lines
+    assert types.count(TokenType.NUMBER) == lines
+    assert types.count(TokenType.SEMICOLON) == lines
+    assert types[-1] == TokenType.EOF
     
-    # Should have 1000 LET, 1000 IDENTIFIER, 1000 EQUAL, 1000 NUMBER, 1000 SEMICOLON, 1 EOF
-    assert len([t for t in tokens if t.type == TokenType.LET]) == 1000
-    assert len([t for t in tokens if t.type == TokenType.IDENTIFIER]) == 1000
-    assert len([t for t in tokens if t.type == TokenType.EQUAL]) == 1000
-    assert len([t for t in tokens if t.type == TokenType.NUMBER]) == 1000
-    assert len([t for t in tokens if t.type == TokenType.SEMICOLON]) == 1000
-    assert tokens[-1].type == TokenType.EOF
+    # Timing is machine dependent; NOOCRUSH_NO_PERF turns the budget check off
+    if not os.environ.get("NOOCRUSH_NO_PERF"):
+        budget_ns = BUDGET_NS * lines // 1000
+        assert elapsed_ns < budget_ns, f"Scanning {lines} lines took {elapsed_ns}ns (budget {budget_ns}ns)"
@@ -10,11 +10,12 @@ from noocrush.ast import (
     Assign, Logical, Get, Set, This, Super, ListLiteral, DictLiteral, Subscript, Slice, ListComprehension
 )
 
+_SCANNER = Scanner()
+
 def parse_source(source):
     """Helper function to parse source code and return the AST."""
-    scanner = Scanner()
-    scanner.source = source
-    tokens = scanner.scan_tokens()
+    _SCANNER.reset(source)
+    tokens = _SCANNER.scan_tokens()
     parser = Parser(tokens)
     return parser.parse()
 
@@ -29,17 +30,17 @@ def test_variable_declaration():
     assert len(statements) == 2
     
     # Check first declaration (let x = 42;)
-    assert isinstance(statements[0], VariableDeclaration)
+    assert type(statements[0]) is VariableDeclaration
     assert statements[0].name.lexeme == "x"
     assert statements[0].mutable is True
-    assert isinstance(statements[0].initializer, Literal)
+    assert type(statements[0].initializer) is Literal
     assert statements[0].initializer.value == 42
     
     # Check second declaration (const name = "NooCrush";)
-    assert isinstance(statements[1], VariableDeclaration)
+    assert type(statements[1]) is VariableDeclaration
     assert statements[1].name.lexeme == "name"
     assert statements[1].mutable is False
-    assert isinstance(statements[1].initializer, Literal)
+    assert type(statements[1].initializer) is Literal
     assert statements[1].initializer.value == "NooCrush"
 
 def test_function_declaration():
@@ -52,7 +53,7 @@ def test_function_declaration():
     statements = parse_source(source)
     
     assert len(statements) == 1
-    assert isinstance(statements[0], FunctionDeclaration)
+    assert type(statements[0]) is FunctionDeclaration
     assert statements[0].name.lexeme == "add"
     
     # Check parameters
@@ -67,8 +68,8 @@ def test_function_declaration():
     
     # Check body
     assert len(statements[0].body) == 1
-    assert isinstance(statements[0].body[0], ReturnStatement)
-    assert isinstance(statements[0].body[0].value, Binary)
+    assert type(statements[0].body[0]) is ReturnStatement
+    assert type(statements[0].body[0].value) is Binary
 
 def test_if_statement():
     """Test parsing if statements."""
@@ -84,21 +85,21 @@ def test_if_statement():
     statements = parse_source(source)
     
     assert len(statements) == 1
-    assert isinstance(statements[0], IfStatement)
+    assert type(statements[0]) is IfStatement
     
     # Check condition
-    assert isinstance(statements[0].condition, Binary)
+    assert type(statements[0].condition) is Binary
     
     # Check then branch
     assert len(statements[0].then_branch) == 1
-    assert isinstance(statements[0].then_branch[0], ExpressionStatement)
+    assert type(statements[0].then_branch[0]) is ExpressionStatement
     
     # Check else if branch
-    assert isinstance(statements[0].else_branch, IfStatement)
+    assert type(statements[0].else_branch) is IfStatement
     
     # Check else branch
     assert len(statements[0].else_branch.else_branch) == 1
-    assert isinstance(statements[0].else_branch.else_branch[0], ExpressionStatement)
+    assert type(statements[0].else_branch.else_branch[0]) is ExpressionStatement
 
 def test_while_loop():
     """Test parsing while loops."""
@@ -111,15 +112,15 @@ def test_while_loop():
     statements = parse_source(source)
     
     assert len(statements) == 1
-    assert isinstance(statements[0], WhileStatement)
+    assert type(statements[0]) is WhileStatement
     
     # Check condition
-    assert isinstance(statements[0].condition, Binary)
+    assert type(statements[0].condition) is Binary
     
     # Check body
     assert len(statements[0].body) == 2
-    assert isinstance(statements[0].body[0], ExpressionStatement)
-    assert isinstance(statements[0].body[1], ExpressionStatement)
+    assert type(statements[0].body[0]) is ExpressionStatement
+    assert type(statements[0].body[1]) is ExpressionStatement
 
 def test_binary_expressions():
     """Test parsing binary expressions with proper operator precedence."""
@@ -128,20 +129,20 @@ def test_binary_expressions():
     
     # Should be a single expression statement
     assert len(statements) == 1
-    assert isinstance(statements[0], ExpressionStatement)
+    assert type(statements[0]) is ExpressionStatement
     
     # Check operator precedence: 1 + (2 * 3) == 7 && true || false
     expr = statements[0].expression
-    assert isinstance(expr, Logical)
+    assert type(expr) is Logical
     assert expr.operator.type == "OR"
     
     # Left side of OR: (1 + (2 * 3) == 7) && true
     left = expr.left
-    assert isinstance(left, Logical)
+    assert type(left) is Logical
     assert left.operator.type == "AND"
     
     # Right side of OR: false
-    assert isinstance(expr.right, Literal)
+    assert type(expr.right) is Literal
     assert expr.right.value is False
 
 def test_list_operations():
@@ -156,18 +157,18 @@ def test_list_operations():
     assert len(statements) == 3
     
     # Check list literal
-    assert isinstance(statements[0], VariableDeclaration)
-    assert isinstance(statements[0].initializer, ListLiteral)
+    assert type(statements[0]) is VariableDeclaration
+    assert type(statements[0].initializer) is ListLiteral
     assert len(statements[0].initializer.elements) == 3
     
     # Check list indexing
-    assert isinstance(statements[1], VariableDeclaration)
-    assert isinstance(statements[1].initializer, Subscript)
+    assert type(statements[1]) is VariableDeclaration
+    assert type(statements[1].initializer) is Subscript
     
     # Check list slicing
-    assert isinstance(statements[2], VariableDeclaration)
-    assert isinstance(statements[2].initializer, Subscript)
-    assert isinstance(statements[2].initializer.slice, Slice)
+    assert type(statements[2]) is VariableDeclaration
+    assert type(statements[2].initializer) is Subscript
+    assert type(statements[2].initializer.slice) is Slice
 
 def test_list_comprehension():
     """Test parsing list comprehensions."""
@@ -175,16 +176,16 @@ def test_list_comprehension():
     statements = parse_source(source)
     
     assert len(statements) == 1
-    assert isinstance(statements[0], ExpressionStatement)
-    assert isinstance(statements[0].expression, ListComprehension)
+    assert type(statements[0]) is ExpressionStatement
+    assert type(statements[0].expression) is ListComprehension
     
     lc = statements[0].expression
-    assert isinstance(lc.expression, Binary)
-    assert isinstance(lc.item, Variable)
+    assert type(lc.expression) is Binary
+    assert type(lc.item) is Variable
     assert lc.item.name.lexeme == "x"
-    assert isinstance(lc.iterable, Variable)
+    assert type(lc.iterable) is Variable
     assert lc.iterable.name.lexeme == "numbers"
-    assert isinstance(lc.condition, Binary)
+    assert type(lc.condition) is Binary
 
 def test_dict_literal():
     """Test parsing dictionary literals."""
@@ -198,17 +199,17 @@ def test_dict_literal():
     statements = parse_source(source)
     
     assert len(statements) == 1
-    assert isinstance(statements[0], VariableDeclaration)
-    assert isinstance(statements[0].initializer, DictLiteral)
+    assert type(statements[0]) is VariableDeclaration
+    assert type(statements[0].initializer) is DictLiteral
     
     # Check dictionary entries
     entries = statements[0].initializer.entries
     assert len(entries) == 3
     
     # Check first entry ("name": "Alice")
-    assert isinstance(entries[0]["key"], Literal)
+    assert type(entries[0]["key"]) is Literal
     assert entries[0]["key"].value == "name"
-    assert isinstance(entries[0]["value"], Literal)
+    assert type(entries[0]["value"]) is Literal
     assert entries[0]["value"].value == "Alice"
     
     # Check second entry ("age": 30)
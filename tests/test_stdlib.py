@@ -1,27 +1,32 @@
 """
 Tests for the NooCrush standard library.
 """
+import math
+from functools import lru_cache
+
 import pytest
-from noocrush.interpreter import Interpreter
 from noocrush.lexer import Scanner
 from noocrush.parser import Parser
 
+_SCANNER = Scanner()
+
+@lru_cache(maxsize=4096)
+def _compile(source):
+    """Scan and parse each distinct snippet once (see test_interpreter)."""
+    _SCANNER.reset(source)
+    return Parser(_SCANNER.scan_tokens()).parse()
+
 class TestStandardLibrary:
     """Test suite for the NooCrush standard library."""
     
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, interpreter):
         """Set up test fixtures."""
-        self.interpreter = Interpreter()
+        self.interpreter = interpreter
         
     def interpret(self, source):
         """Helper method to interpret source code."""
-        scanner = Scanner()
-        scanner.source = source
-        tokens = scanner.scan_tokens()
-        parser = Parser(tokens)
-        statements = parser.parse()
-        return self.interpreter.interpret(statements)
+        return self.interpreter.interpret(_compile(source))
     
     # Math functions
     def test_math_functions(self):
@@ -34,14 +39,10 @@ class TestStandardLibrary:
         assert self.interpret("sqrt(16)") == 4.0
         assert self.interpret("round(3.14159, 2)") == 3.14
         
-        # Trigonometry (values are approximate)
-        assert abs(self.interpret("sin(0)")) < 1e-10
-        assert abs(self.interpret("cos(0)") - 1) < 1e-10
-        assert abs(self.interpret("tan(0)")) < 1e-10
-        
-        # Constants
-        assert abs(self.interpret("PI") - 3.141592653589793) < 1e-10
-        assert abs(self.interpret("E") - 2.718281828459045) < 1e-10
+        # Trigonometry and constants (values are approximate), in one program
+        assert self.interpret("[sin(0), cos(0), tan(0), PI, E]") == pytest.approx(
+            [0, 1, 0, math.pi, math.e], abs=1e-10
+        )
     
     # String functions
     def test_string_functions(self):
@@ -126,18 +127,31 @@ class TestStandardLibrary:
     # Functional programming
     def test_functional_programming(self):
         """Test functional programming utilities."""
+        # All cases run as one program that returns their results as a list
+        results = self.interpret("""
+        [
+            [1, 2, 3].map(fn(x) { return x * 2 }),
+            [1, 2, 3, 4].filter(fn(x) { return x % 2 == 0 }),
+            [1, 2, 3, 4].reduce(fn(acc, x) { return acc + x }, 0),
+            range(5),
+            range(1, 4),
+            range(0, 10, 2),
+            zip([1, 2], ["a", "b"])
+        ]
+        """)
+        
         # Map, filter, reduce
-        assert self.interpret("[1, 2, 3].map(fn(x) { return x * 2 })") == [2, 4, 6]
-        assert self.interpret("[1, 2, 3, 4].filter(fn(x) { return x % 2 == 0 })") == [2, 4]
-        assert self.interpret("[1, 2, 3, 4].reduce(fn(acc, x) { return acc + x }, 0)") == 10
+        assert results[0] == [2, 4, 6]
+        assert results[1] == [2, 4]
+        assert results[2] == 10
         
         # Range
-        assert self.interpret("range(5)") == [0, 1, 2, 3, 4]
-        assert self.interpret("range(1, 4)") == [1, 2, 3]
-        assert self.interpret("range(0, 10, 2)") == [0, 2, 4, 6, 8]
+        assert results[3] == [0, 1, 2, 3, 4]
+        assert results[4] == [1, 2, 3]
+        assert results[5] == [0, 2, 4, 6, 8]
         
         # Zip
-        assert self.interpret('zip([1, 2], ["a", "b"])') == [[1, "a"], [2, "b"]]
+        assert results[6] == [[1, "a"], [2, "b"]]
     
     # I/O functions (mocked)
     def test_io_functions(self, mocker):
@@ -0,0 +1,57 @@
+"""
+Tests for the NooCrush type system.
+"""
+from noocrush.types import (
+    NEVER_TYPE, NUMBER_TYPE, STRING_TYPE, FunctionType, ListType, StructType, TypeVariable,
+    UnionType, get_common_supertype, instantiate_generic
+)
+
+def test_instantiate_nested_generic():
+    """Test instantiating a struct whose fields nest lists and functions."""
+    t = TypeVariable(name="T")
+    generic = StructType(
+        name="Box",
+        fields={
+            "items": ListType(element_type=t),
+            "map": FunctionType(parameter_types=[t], return_type=ListType(element_type=t)),
+        },
+        type_parameters=["T"]
+    )
+
+    result = instantiate_generic(generic, {"T": NUMBER_TYPE})
+
+    assert result.name == "Box"
+    assert result.type_parameters == ()
+    assert result.get_field_type("items") == ListType(element_type=NUMBER_TYPE)
+    mapper = result.get_field_type("map")
+    assert mapper.parameter_types == (NUMBER_TYPE,)
+    assert mapper.return_type == ListType(element_type=NUMBER_TYPE)
+    # The generic type itself is left untouched
+    assert generic.get_field_type("items") == ListType(element_type=t)
+
+def test_instantiate_deeply_nested_list():
+    """Test instantiating a list type nested many levels deep."""
+    nested = TypeVariable(name="T")
+    for _ in range(200):
+        nested = ListType(element_type=nested)
+
+    result = instantiate_generic(nested, {"T": STRING_TYPE})
+
+    depth = 0
+    while isinstance(result, ListType):
+        result = result.element_type
+        depth += 1
+    assert depth == 200
+    assert result == STRING_TYPE
+
+def test_common_supertype():
+    """Test the common supertype of same-kind and mixed-kind types."""
+    assert get_common_supertype([]) == NEVER_TYPE
+    assert get_common_supertype([NUMBER_TYPE, NUMBER_TYPE]) is NUMBER_TYPE
+
+    # Mixed kinds give a union, deduplicated in first-seen order
+    mixed = get_common_supertype([NUMBER_TYPE, STRING_TYPE, NUMBER_TYPE])
+    assert isinstance(mixed, UnionType)
+    assert mixed.types == (NUMBER_TYPE, STRING_TYPE)
+    assert NUMBER_TYPE.is_subtype_of(mixed)
+    assert STRING_TYPE.is_subtype_of(mixed)